@@ -1,30 +1,87 @@
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from src.api import search_router, recommendations_router, comparison_router
-from src.core import Database, PanelSearchException
+from src.api.routes.search import search_service
+from src.api.routes.recommendations import recommendation_service
+from src.api.middleware import CompressionMiddleware, DeadlineMiddleware
+from src.core import settings, Database, PanelSearchException, metrics, circuit_breakers
+from src.repositories import search_history_writer
+from src.llm import http_clients
+from src.services import feed_refresher, member_profiles, warm_up
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    app.state.ready = False
+    app.state.warmup = None
+    await search_history_writer.start()
+    if settings.feed_refresh_enabled:
+        await feed_refresher.start(recommendation_service)
+
+    warmup_task = None
+    if settings.warmup_enabled:
+        warmup_task = asyncio.create_task(run_warm_up(app))
+    else:
+        app.state.ready = True
+
     yield
+    if warmup_task is not None:
+        warmup_task.cancel()
+        try:
+            await warmup_task
+        except asyncio.CancelledError:
+            pass
+    await feed_refresher.close()
+    await search_history_writer.close()
+    await member_profiles.close()
+    await http_clients.aclose()
     await Database.close_pool()
 
 
+async def run_warm_up(app: FastAPI):
+    for attempt in range(1, settings.warmup_attempts + 1):
+        try:
+            app.state.warmup = await warm_up(search_service, recommendation_service)
+            break
+        except Exception as e:
+            app.state.warmup = {"error": str(e), "attempts": attempt}
+            if attempt < settings.warmup_attempts:
+                await asyncio.sleep(settings.warmup_retry_backoff * 2 ** (attempt - 1))
+    app.state.ready = True
+
+
 app = FastAPI(
     title="Panel Search API",
     version="2.1.0",
     lifespan=lifespan,
 )
 
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_min_size,
+    zstd_level=settings.compression_zstd_level,
+    gzip_level=settings.compression_gzip_level,
+)
+
+app.add_middleware(
+    DeadlineMiddleware,
+    header=settings.request_budget_header,
+    default_budget=settings.request_budget_default,
+    max_budget=settings.request_budget_max,
+    endpoint_budgets=settings.request_budgets,
+)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Skipped-Stages"],
 )
 
 
@@ -53,6 +110,28 @@ async def health_check():
     }
 
 
+@app.get("/ready", tags=["system"])
+async def readiness_check():
+    ready = getattr(app.state, "ready", False)
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "status": "ready" if ready else "warming_up",
+            "warmup": getattr(app.state, "warmup", None)
+        }
+    )
+
+
+@app.get("/metrics", tags=["system"])
+async def get_metrics():
+    return metrics.snapshot()
+
+
+@app.get("/circuits", tags=["system"])
+async def get_circuits():
+    return {name: breaker.snapshot() for name, breaker in circuit_breakers.items()}
+
+
 @app.get("/api/info", tags=["system"])
 async def api_info():
     return {
@@ -64,6 +143,7 @@ async def api_info():
                 "description": "패널 검색 API",
                 "endpoints": [
                     "POST /api/search/",
+                    "POST /api/search/batch",
                     "POST /api/search/search-result/{search_id}/refine",
                     "GET /api/search/search-result/{search_id}/info",
                     "GET /api/search/available-filters"
@@ -83,6 +163,7 @@ async def api_info():
                 "description": "코호트 비교 분석 API",
                 "endpoints": [
                     "POST /api/cohort-comparison/compare",
+                    "POST /api/cohort-comparison/compare/stream",
                     "GET /api/cohort-comparison/metrics"
                 ]
             }
@@ -0,0 +1,57 @@
+import argparse
+import json
+import time
+
+import orjson
+
+
+SURVEY_COLUMNS = [
+    'survey_health', 'survey_consumption', 'survey_lifestyle',
+    'survey_digital', 'survey_environment'
+]
+
+
+def make_rows(count: int, questions: int) -> list:
+    rows = []
+    for i in range(count):
+        survey = {
+            f"문항{q}": {"응답": f"응답 {q} - 주 2~3회 정도", "점수": (i + q) % 5, "선택": ["예", "아니오"]}
+            for q in range(questions)
+        }
+        encoded = json.dumps(survey, ensure_ascii=False)
+        rows.append({column: encoded for column in SURVEY_COLUMNS})
+    return rows
+
+
+def decode_rows(rows: list, loads) -> int:
+    decoded = 0
+    for row in rows:
+        for column in SURVEY_COLUMNS:
+            if loads(row[column]):
+                decoded += 1
+    return decoded
+
+
+def bench(label: str, loads, rows: list, repeat: int) -> None:
+    decode_rows(rows, loads)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        decode_rows(rows, loads)
+    elapsed = (time.perf_counter() - started) / repeat
+    print(f"{label:>10}: {elapsed * 1000:8.2f} ms/result set  {elapsed / len(rows) * 1e6:6.2f} us/row")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="survey JSONB column decode micro-benchmark")
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--questions", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows, args.questions)
+    bench("json", json.loads, rows, args.repeat)
+    bench("orjson", orjson.loads, rows, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
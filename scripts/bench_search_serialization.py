@@ -0,0 +1,88 @@
+import argparse
+import json
+import time
+
+from src.api.responses import FastJSONResponse
+from src.api.schemas.search import MainSearchResponse, PanelInfo
+from src.domain.models import Panel
+from src.repositories import PanelRepository
+
+
+def make_rows(count: int) -> list:
+    survey = {f"문항{i}": f"응답 {i} - 주 2~3회 정도" for i in range(12)}
+    return [
+        {
+            "panel_id": f"w{100000 + i}",
+            "age": 20 + i % 40,
+            "gender": "FEMALE" if i % 2 else "MALE",
+            "residence": "서울 강남구",
+            "occupation": "사무직 (회사원, 공무원 등)",
+            "marital_status": "미혼",
+            "phone_brand": "삼성전자 (갤럭시, 노트)",
+            "car_brand": "현대",
+            "profile_summary": "30대 서울 거주 사무직 여성으로 온라인 쇼핑과 OTT 서비스를 즐겨 이용함" * 2,
+            "hashtags": ["#서울", "#직장인", "#OTT", "#온라인쇼핑", "#갤럭시"],
+            "electronic_devices": ["스마트폰", "노트북", "태블릿", "스마트워치"],
+            "smoking_experience": ["담배를 피워본 적이 없다"],
+            "cigarette_brands": [],
+            "e_cigarette": [],
+            "drinking_experience": ["맥주", "소주"],
+            "survey_health": json.dumps(survey, ensure_ascii=False),
+            "survey_consumption": json.dumps(survey, ensure_ascii=False),
+            "survey_lifestyle": json.dumps(survey, ensure_ascii=False),
+            "survey_digital": json.dumps(survey, ensure_ascii=False),
+            "survey_environment": json.dumps(survey, ensure_ascii=False),
+            "similarity": 0.5 + (i % 30) / 100,
+        }
+        for i in range(count)
+    ]
+
+
+def result_payload(panels: list) -> dict:
+    return {
+        "search_id": "1",
+        "query": "30대 서울 거주 여성",
+        "panels": panels,
+        "total_count": len(panels),
+        "search_mode": "strict",
+        "applied_filters": {"age_group": "30대", "gender": "FEMALE"},
+        "search_method": "natural_language",
+        "facets": None,
+    }
+
+
+def validated_path(repo: PanelRepository, rows: list) -> bytes:
+    panels = [Panel(**repo._row_to_panel(row).__dict__) for row in rows]
+    infos = [PanelInfo(**panel.__dict__) for panel in panels]
+    return MainSearchResponse(**result_payload(infos)).model_dump_json().encode()
+
+
+def fast_path(repo: PanelRepository, rows: list) -> bytes:
+    panels = [repo._row_to_panel(row) for row in rows]
+    infos = [PanelInfo.model_construct(**panel.__dict__) for panel in panels]
+    return FastJSONResponse(result_payload(infos)).body
+
+
+def bench(label: str, fn, repo: PanelRepository, rows: list, repeat: int) -> None:
+    fn(repo, rows)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn(repo, rows)
+    elapsed = (time.perf_counter() - started) / repeat
+    print(f"{label:>10}: {elapsed * 1000:8.2f} ms/response  {elapsed / len(rows) * 1e6:6.2f} us/row")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="row -> JSON response micro-benchmark")
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    repo = PanelRepository()
+    rows = make_rows(args.rows)
+    bench("validated", validated_path, repo, rows, args.repeat)
+    bench("fast", fast_path, repo, rows, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
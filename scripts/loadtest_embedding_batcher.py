@@ -0,0 +1,108 @@
+import argparse
+import asyncio
+import json
+import statistics
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.llm.embeddings import EmbeddingBatcher
+
+
+class StubEmbeddingHandler(BaseHTTPRequestHandler):
+    base_latency = 0.05
+    per_item_latency = 0.001
+    dimension = 4096
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        inputs = body["input"] if isinstance(body["input"], list) else [body["input"]]
+        time.sleep(self.base_latency + self.per_item_latency * len(inputs))
+
+        payload = json.dumps({
+            "data": [
+                {"index": i, "embedding": [float(len(text))] * self.dimension}
+                for i, text in enumerate(inputs)
+            ]
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server() -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubEmbeddingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_client(url: str):
+    calls = {"count": 0}
+
+    def embed_texts(texts):
+        calls["count"] += 1
+        request = urllib.request.Request(
+            url,
+            data=json.dumps({"model": "embedding-query", "input": texts}).encode(),
+            headers={"Content-Type": "application/json"}
+        )
+        with urllib.request.urlopen(request) as response:
+            data = json.loads(response.read())["data"]
+        return [item["embedding"] for item in sorted(data, key=lambda item: item["index"])]
+
+    return embed_texts, calls
+
+
+async def run(label: str, embed, requests: int, concurrency: int, calls: dict) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one(i: int):
+        async with semaphore:
+            started = time.perf_counter()
+            await embed(f"서울 거주 30대 직장인 {i % 50}")
+            latencies.append(time.perf_counter() - started)
+
+    calls["count"] = 0
+    started = time.perf_counter()
+    await asyncio.gather(*[one(i) for i in range(requests)])
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(
+        f"{label:>10}: {requests / elapsed:8.1f} req/s  "
+        f"p50 {statistics.median(latencies) * 1000:7.1f} ms  p95 {p95 * 1000:7.1f} ms  "
+        f"upstream calls {calls['count']}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="embedding micro-batcher load test against a local stub server")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--window-ms", type=float, default=5.0)
+    parser.add_argument("--max-batch", type=int, default=32)
+    args = parser.parse_args()
+
+    server = start_stub_server()
+    embed_texts, calls = make_client(f"http://127.0.0.1:{server.server_port}/embeddings")
+
+    async def unbatched(text):
+        return (await asyncio.to_thread(embed_texts, [text]))[0]
+
+    batcher = EmbeddingBatcher(embed_texts, window_ms=args.window_ms, max_batch=args.max_batch)
+
+    await run("unbatched", unbatched, args.requests, args.concurrency, calls)
+    await run("batched", batcher.embed, args.requests, args.concurrency, calls)
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,31 @@
+import asyncio
+
+from src.core.database import Database
+
+
+SCHEMA_STATEMENTS = [
+    """
+    CREATE TABLE IF NOT EXISTS member_interest_profile (
+        member_id integer PRIMARY KEY,
+        counters jsonb NOT NULL DEFAULT '{}'::jsonb,
+        search_count integer NOT NULL DEFAULT 0,
+        updated_at double precision NOT NULL DEFAULT 0
+    )
+    """,
+]
+
+
+async def migrate() -> None:
+    for statement in SCHEMA_STATEMENTS:
+        await Database.execute(statement)
+
+    await Database.close_pool()
+    print("done. member_interest_profile is ready")
+
+
+def main() -> None:
+    asyncio.run(migrate())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import asyncio
+
+from src.core.database import Database
+from src.repositories import PanelRepository
+
+
+SCHEMA_STATEMENTS = [
+    """
+    CREATE TABLE IF NOT EXISTS panel_version (
+        id integer PRIMARY KEY,
+        version bigint NOT NULL
+    )
+    """,
+    """
+    CREATE OR REPLACE FUNCTION bump_panel_version() RETURNS trigger AS $$
+    BEGIN
+        INSERT INTO panel_version (id, version) VALUES (1, 1)
+        ON CONFLICT (id) DO UPDATE SET version = panel_version.version + 1;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS panel_version_bump ON panel",
+    """
+    CREATE TRIGGER panel_version_bump
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON panel
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_panel_version()
+    """,
+]
+
+
+async def migrate() -> None:
+    for statement in SCHEMA_STATEMENTS:
+        await Database.execute(statement)
+
+    version = await PanelRepository().bump_version()
+    await Database.close_pool()
+    print(f"done. panel_version is {version}; panel writes now bump it")
+
+
+def main() -> None:
+    asyncio.run(migrate())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+import asyncio
+
+from src.core.database import Database
+
+
+SCHEMA_STATEMENTS = [
+    """
+    CREATE TABLE IF NOT EXISTS member_recommendation_feed (
+        member_id integer NOT NULL,
+        industry text NOT NULL,
+        feed jsonb NOT NULL,
+        generated_at timestamptz NOT NULL DEFAULT now(),
+        PRIMARY KEY (member_id, industry)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS member_recommendation_feed_generated_at_idx ON member_recommendation_feed (generated_at)",
+]
+
+
+async def migrate() -> None:
+    for statement in SCHEMA_STATEMENTS:
+        await Database.execute(statement)
+
+    await Database.close_pool()
+    print("done. member_recommendation_feed is ready")
+
+
+def main() -> None:
+    asyncio.run(migrate())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+import argparse
+import asyncio
+import json
+
+from src.core.database import Database
+
+
+SCHEMA_STATEMENTS = [
+    "ALTER TABLE panel ADD COLUMN IF NOT EXISTS seq serial",
+    "CREATE UNIQUE INDEX IF NOT EXISTS panel_seq_idx ON panel (seq)",
+    "ALTER TABLE search_history ADD COLUMN IF NOT EXISTS panel_seqs int4[]",
+    "ALTER TABLE search_history ADD COLUMN IF NOT EXISTS concordance_rates real[]",
+]
+
+BACKFILL_SQL = """
+    UPDATE search_history
+    SET panel_seqs = ARRAY(
+            SELECT p.seq
+            FROM unnest($2::text[]) WITH ORDINALITY AS t(panel_id, ord)
+            JOIN panel p ON p.id = t.panel_id
+            ORDER BY t.ord
+        ),
+        concordance_rates = ARRAY(
+            SELECT (concordance_rate[t.ord])::real
+            FROM unnest($2::text[]) WITH ORDINALITY AS t(panel_id, ord)
+            JOIN panel p ON p.id = t.panel_id
+            ORDER BY t.ord
+        )
+    WHERE id = $1
+"""
+
+
+async def migrate(batch_size: int, drop_legacy: bool) -> None:
+    for statement in SCHEMA_STATEMENTS:
+        await Database.execute(statement)
+
+    migrated = 0
+    last_id = 0
+    while True:
+        rows = await Database.fetch("""
+            SELECT id, panel_ids FROM search_history
+            WHERE panel_seqs IS NULL AND id > $1
+            ORDER BY id
+            LIMIT $2
+        """, last_id, batch_size)
+
+        if not rows:
+            break
+
+        updates = []
+        for row in rows:
+            panel_ids = row['panel_ids'] or []
+            if isinstance(panel_ids, str):
+                panel_ids = json.loads(panel_ids)
+            updates.append((row['id'], [str(pid) for pid in panel_ids]))
+
+        async with Database.connection() as conn:
+            await conn.executemany(BACKFILL_SQL, updates)
+
+        migrated += len(rows)
+        last_id = rows[-1]['id']
+        print(f"migrated {migrated} rows (last id {last_id})")
+
+    if drop_legacy:
+        await Database.execute("""
+            UPDATE search_history
+            SET panel_ids = NULL, concordance_rate = NULL
+            WHERE panel_seqs IS NOT NULL
+        """)
+        print("cleared legacy panel_ids/concordance_rate columns")
+
+    await Database.close_pool()
+    print("done. set HISTORY_COMPACT_STORAGE=true to read and write the compact columns")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="search_history panel_ids -> int4[]/real[] migration")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--drop-legacy", action="store_true")
+    args = parser.parse_args()
+
+    asyncio.run(migrate(args.batch_size, args.drop_legacy))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+import gzip
+from typing import Dict, List, Optional, Tuple
+
+import zstandard
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core import deadline
+
+
+class CompressionMiddleware:
+    SKIP_CONTENT_TYPES = ("text/event-stream", "image/", "video/", "audio/")
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, zstd_level: int = 3, gzip_level: int = 6):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.zstd_compressor = zstandard.ZstdCompressor(level=zstd_level)
+        self.gzip_level = gzip_level
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = self._negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, self._vary_wrapper(send))
+            return
+
+        start_message: Optional[Message] = None
+        body_parts: List[bytes] = []
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, passthrough
+
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                content_type = headers.get("content-type", "")
+                if "content-encoding" in headers or content_type.startswith(self.SKIP_CONTENT_TYPES):
+                    passthrough = True
+                    await send(message)
+                    return
+                start_message = message
+                return
+
+            body_parts.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            await self._send_buffered(send, start_message, b"".join(body_parts), encoding)
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _vary_wrapper(self, send: Send) -> Send:
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=message["headers"])
+                if not headers.get("content-type", "").startswith(self.SKIP_CONTENT_TYPES):
+                    headers.add_vary_header("Accept-Encoding")
+            await send(message)
+
+        return send_wrapper
+
+    async def _send_buffered(self, send: Send, start_message: Message, body: bytes, encoding: str) -> None:
+        headers = MutableHeaders(raw=start_message["headers"])
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+
+        if len(body) >= self.minimum_size and start_message["status"] not in (204, 304):
+            if encoding == "zstd":
+                body = self.zstd_compressor.compress(body)
+            else:
+                body = gzip.compress(body, compresslevel=self.gzip_level)
+
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(body))
+
+        await send(start_message)
+        await send({"type": "http.response.body", "body": body})
+
+    def _negotiate(self, accept_encoding: str) -> Optional[str]:
+        accepted = {}
+        for part in accept_encoding.split(","):
+            name, quality = self._parse_encoding(part)
+            if name:
+                accepted[name] = quality
+
+        for encoding in ("zstd", "gzip"):
+            if accepted.get(encoding, 0) > 0:
+                return encoding
+        return None
+
+    def _parse_encoding(self, part: str) -> Tuple[str, float]:
+        pieces = [p.strip() for p in part.split(";")]
+        name = pieces[0].lower()
+        quality = 1.0
+        for param in pieces[1:]:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        return name, quality
+
+
+class DeadlineMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        header: str,
+        default_budget: float,
+        max_budget: float,
+        endpoint_budgets: Dict[str, float]
+    ):
+        self.app = app
+        self.header = header.lower()
+        self.default_budget = default_budget
+        self.max_budget = max_budget
+        self.endpoint_budgets = sorted(endpoint_budgets.items(), key=lambda item: len(item[0]), reverse=True)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        deadline.start(self._budget(scope))
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                skipped = deadline.skipped_stages()
+                if skipped:
+                    headers = MutableHeaders(raw=message["headers"])
+                    headers["X-Skipped-Stages"] = ",".join(skipped)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _budget(self, scope: Scope) -> float:
+        requested = Headers(scope=scope).get(self.header)
+        if requested:
+            try:
+                return min(max(float(requested), 0.0), self.max_budget)
+            except ValueError:
+                pass
+
+        path = scope.get("path", "")
+        for prefix, budget in self.endpoint_budgets:
+            if path.startswith(prefix):
+                return budget
+        return self.default_budget
@@ -1,9 +1,11 @@
 from typing import Optional, List
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
 
 from src.services import ComparisonService
 from src.core.exceptions import NotFoundError
 from src.api.schemas.comparison import ComparisonResponse
+from src.api.responses import etag_json_response, sse_event
 
 
 router = APIRouter(prefix="/api/cohort-comparison", tags=["comparison"])
@@ -27,6 +29,38 @@ async def compare_two_cohorts(
         raise HTTPException(status_code=404, detail=e.message)
 
 
+@router.post("/compare/stream")
+async def stream_two_cohorts(
+    cohort_1_id: int,
+    cohort_2_id: int,
+    metrics: Optional[List[str]] = None
+):
+    events = comparison_service.stream_comparison(
+        cohort_1_id=cohort_1_id,
+        cohort_2_id=cohort_2_id,
+        metrics=metrics
+    )
+    try:
+        first_event = await events.__anext__()
+    except NotFoundError as e:
+        raise HTTPException(status_code=404, detail=e.message)
+
+    async def body():
+        yield sse_event(*first_event)
+        try:
+            async for event in events:
+                yield sse_event(*event)
+        except Exception as e:
+            yield sse_event("error", {"stage": "stream", "error": "INTERNAL_SERVER_ERROR", "message": str(e)})
+            yield sse_event("done", {"key_insights": None, "skipped_stages": [], "failed_stages": ["stream"]})
+
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/metrics")
-async def get_available_metrics():
-    return {"metrics": comparison_service.get_available_metrics()}
+async def get_available_metrics(request: Request):
+    return etag_json_response(request, {"metrics": comparison_service.get_available_metrics()})
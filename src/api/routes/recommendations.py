@@ -27,7 +27,8 @@ async def get_recommendations(request: RecommendationRequest):
     return await recommendation_service.get_recommendations(
         search_history=request.search_history,
         industry=request.industry,
-        limit=request.limit
+        limit=request.limit,
+        member_id=request.member_id
     )
 
 
@@ -5,6 +5,10 @@ from .search import (
     RefineSearchRequest,
     RefineSearchResponse,
     AvailableFiltersResponse,
+    BatchSearchItem,
+    BatchSearchRequest,
+    BatchSearchResult,
+    BatchSearchResponse,
 )
 from .recommendation import (
     RecommendationRequest,
@@ -30,6 +34,10 @@ __all__ = [
     "RefineSearchRequest",
     "RefineSearchResponse",
     "AvailableFiltersResponse",
+    "BatchSearchItem",
+    "BatchSearchRequest",
+    "BatchSearchResult",
+    "BatchSearchResponse",
     "RecommendationRequest",
     "RecommendationResponse",
     "PersonalizedRecommendation",
@@ -69,3 +69,4 @@ class ComparisonResponse(BaseModel):
     gender_distribution: Optional[GenderDistribution] = None
     key_insights: Optional[KeyInsights] = None
     summary: Dict[str, Any]
+    skipped_stages: List[str] = []
@@ -9,6 +9,7 @@ class MainSearchRequest(BaseModel):
     structured_filters: Optional[Dict[str, Any]] = Field(default=None)
     search_mode: str = Field(default="strict")
     limit: int = Field(default=100, ge=1, le=1000)
+    facets: Optional[List[str]] = Field(default=None)
 
 
 class PanelInfo(BaseModel):
@@ -43,6 +44,36 @@ class MainSearchResponse(BaseModel):
     search_mode: str
     applied_filters: Dict[str, Any]
     search_method: str
+    facets: Optional[Dict[str, Dict[str, int]]] = None
+
+
+class BatchSearchItem(BaseModel):
+    member_id: Optional[int] = Field(default=None)
+    query: Optional[str] = Field(default=None)
+    search_params: Optional[Dict[str, Any]] = Field(default=None)
+    structured_filters: Optional[Dict[str, Any]] = Field(default=None)
+    search_mode: str = Field(default="strict")
+    limit: int = Field(default=100, ge=1, le=1000)
+    facets: Optional[List[str]] = Field(default=None)
+
+
+class BatchSearchRequest(BaseModel):
+    member_id: Optional[int] = Field(default=None)
+    searches: List[BatchSearchItem] = Field(min_length=1, max_length=20)
+
+
+class BatchSearchResult(BaseModel):
+    index: int
+    success: bool
+    result: Optional[MainSearchResponse] = None
+    error: Optional[str] = None
+
+
+class BatchSearchResponse(BaseModel):
+    results: List[BatchSearchResult]
+    total: int
+    succeeded: int
+    failed: int
 
 
 class RefineSearchRequest(BaseModel):
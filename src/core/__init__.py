@@ -1,10 +1,15 @@
 from .config import settings
 from .database import Database
+from .metrics import metrics
+from .circuit_breaker import circuit_breakers
 from .exceptions import (
     PanelSearchException,
     QueryParsingError,
     DatabaseError,
     LLMError,
+    LLMOverloadedError,
+    CircuitOpenError,
+    DeadlineExceededError,
     NotFoundError,
     ValidationError,
 )
@@ -12,10 +17,15 @@ from .exceptions import (
 __all__ = [
     "settings",
     "Database",
+    "metrics",
+    "circuit_breakers",
     "PanelSearchException",
     "QueryParsingError",
     "DatabaseError",
     "LLMError",
+    "LLMOverloadedError",
+    "CircuitOpenError",
+    "DeadlineExceededError",
     "NotFoundError",
     "ValidationError",
 ]
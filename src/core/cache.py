@@ -0,0 +1,199 @@
+import hashlib
+import json
+import math
+import sys
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config import settings
+
+
+@dataclass(frozen=True)
+class CachedResultSet:
+    panel_ids: Tuple[str, ...]
+    similarities: array
+    facets: Optional[Dict[str, Dict[str, int]]]
+    version: int
+    size: int
+
+    def similarity_list(self) -> List[Optional[float]]:
+        return [None if math.isnan(s) else s for s in self.similarities]
+
+
+class SearchResultCache:
+    IGNORED_KEYS = {'mode', 'match_strategy', 'allow_null_fields', 'exact_match', 'minimum_match_ratio', 'sort_by'}
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, CachedResultSet]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(
+        self,
+        filters: Dict[str, Any],
+        mode: str,
+        limit: int,
+        embedding_id: Optional[str],
+        facets: Optional[List[str]] = None
+    ) -> str:
+        payload = {
+            "filters": self._canonicalize(
+                {k: v for k, v in filters.items() if k not in self.IGNORED_KEYS}
+            ),
+            "mode": mode,
+            "limit": limit,
+            "embedding": embedding_id,
+            "facets": sorted(facets) if facets is not None else None,
+        }
+        encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, version: Optional[int]) -> Optional[CachedResultSet]:
+        entry = self._entries.get(key)
+        if entry is None or version is None or entry.version != version:
+            if entry is not None:
+                self._evict(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(
+        self,
+        key: str,
+        version: Optional[int],
+        panel_ids: List[str],
+        similarities: List[Optional[float]],
+        facets: Optional[Dict[str, Dict[str, int]]] = None
+    ) -> None:
+        if version is None:
+            return
+
+        packed = array('d', (math.nan if s is None else float(s) for s in similarities))
+        size = sum(sys.getsizeof(pid) for pid in panel_ids) + packed.itemsize * len(packed)
+        if facets:
+            size += len(json.dumps(facets, ensure_ascii=False).encode("utf-8"))
+        if size > self.max_bytes:
+            return
+
+        if key in self._entries:
+            self._evict(key)
+
+        self._entries[key] = CachedResultSet(
+            panel_ids=tuple(panel_ids),
+            similarities=packed,
+            facets=facets,
+            version=version,
+            size=size,
+        )
+        self._bytes += size
+
+        while self._bytes > self.max_bytes and self._entries:
+            oldest_key = next(iter(self._entries))
+            self._evict(oldest_key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def _evict(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def _canonicalize(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            return {k: self._canonicalize(v) for k, v in value.items() if v is not None}
+        if isinstance(value, list):
+            items = [self._canonicalize(v) for v in value]
+            if all(isinstance(v, (str, int, float)) for v in items):
+                return sorted(items, key=lambda v: (type(v).__name__, v))
+            return items
+        return value
+
+
+class MemberRecommendationCache:
+    def __init__(self, max_members: int):
+        self.max_members = max_members
+        self._patterns: "OrderedDict[int, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        self._recommendations: "OrderedDict[int, Dict[Tuple, Dict[str, Any]]]" = OrderedDict()
+        self._generations: "OrderedDict[int, int]" = OrderedDict()
+        self._generation_counter = 0
+        self._generation_floor = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get_patterns(self, member_id: int, history_key: str) -> Optional[Dict[str, Any]]:
+        entry = self._patterns.get(member_id)
+        if entry is None or entry[0] != history_key:
+            return None
+
+        self._patterns.move_to_end(member_id)
+        return entry[1]
+
+    def put_patterns(self, member_id: int, history_key: str, patterns: Dict[str, Any]) -> None:
+        self._patterns[member_id] = (history_key, patterns)
+        self._patterns.move_to_end(member_id)
+        self._trim(self._patterns)
+
+    def generation(self, member_id: int) -> int:
+        return self._generations.get(member_id, self._generation_floor)
+
+    def get_recommendations(self, member_id: int, key: Tuple) -> Optional[Dict[str, Any]]:
+        result = self._recommendations.get(member_id, {}).get(key)
+        if result is None:
+            self.misses += 1
+            return None
+
+        self._recommendations.move_to_end(member_id)
+        self.hits += 1
+        return result
+
+    def put_recommendations(self, member_id: int, key: Tuple, generation: int, result: Dict[str, Any]) -> None:
+        if generation != self.generation(member_id):
+            return
+
+        self._recommendations.setdefault(member_id, {})[key] = result
+        self._recommendations.move_to_end(member_id)
+        self._trim(self._recommendations)
+
+    def invalidate(self, member_id: int) -> None:
+        self._generation_counter += 1
+        self._generations[member_id] = self._generation_counter
+        self._generations.move_to_end(member_id)
+        self._recommendations.pop(member_id, None)
+
+        while len(self._generations) > self.max_members:
+            _, evicted = self._generations.popitem(last=False)
+            self._generation_floor = max(self._generation_floor, evicted)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "members": len(self._recommendations),
+            "patterns": len(self._patterns),
+            "generations": len(self._generations),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def _trim(self, entries: OrderedDict) -> None:
+        while len(entries) > self.max_members:
+            entries.popitem(last=False)
+
+
+search_result_cache = SearchResultCache(settings.search_cache_max_bytes)
+recommendation_cache = MemberRecommendationCache(settings.recommendation_cache_max_members)
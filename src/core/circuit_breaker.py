@@ -0,0 +1,117 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+from .config import settings
+from .exceptions import CircuitOpenError, DeadlineExceededError, LLMOverloadedError
+from .metrics import metrics
+
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    def __init__(self, name: str):
+        self.name = name
+        self.state = CLOSED
+        self.opened_at: Optional[float] = None
+        self._outcomes: Deque[bool] = deque(maxlen=settings.circuit_window_size)
+        self._probing = False
+
+    async def call(self, fn: Callable[[], Awaitable[T]]) -> T:
+        async with self.guard():
+            return await fn()
+
+    @asynccontextmanager
+    async def guard(self) -> AsyncIterator[None]:
+        if not self._allow():
+            metrics.increment(f"circuit.{self.name}.short_circuited")
+            raise CircuitOpenError(self.name)
+
+        started = time.monotonic()
+        success: Optional[bool] = False
+        try:
+            yield
+            success = time.monotonic() - started <= settings.circuit_slow_call_seconds
+        except (DeadlineExceededError, LLMOverloadedError, asyncio.CancelledError, GeneratorExit):
+            success = None
+            raise
+        finally:
+            self._record(success)
+
+    def _allow(self) -> bool:
+        if self.state == CLOSED:
+            return True
+
+        if self.state == OPEN:
+            if time.monotonic() - self.opened_at < settings.circuit_open_seconds:
+                return False
+            self._transition(HALF_OPEN)
+
+        if self._probing:
+            return False
+        self._probing = True
+        return True
+
+    def _record(self, success: Optional[bool]) -> None:
+        if success is None:
+            self._probing = False
+            return
+
+        metrics.increment(f"circuit.{self.name}.{'successes' if success else 'failures'}")
+
+        if self.state == HALF_OPEN:
+            self._probing = False
+            if success:
+                self._outcomes.clear()
+                self._transition(CLOSED)
+            else:
+                self._trip()
+            return
+
+        self._outcomes.append(success)
+        if len(self._outcomes) < settings.circuit_min_calls:
+            return
+
+        failure_rate = self._outcomes.count(False) / len(self._outcomes)
+        if failure_rate >= settings.circuit_failure_rate:
+            self._trip()
+
+    def _trip(self) -> None:
+        self.opened_at = time.monotonic()
+        self._transition(OPEN)
+        metrics.increment(f"circuit.{self.name}.opened")
+
+    def _transition(self, state: str) -> None:
+        self.state = state
+        metrics.set_gauge(f"circuit.{self.name}.state", state)
+
+    def snapshot(self) -> Dict[str, Any]:
+        outcomes = len(self._outcomes)
+        retry_in = 0.0
+        if self.state == OPEN:
+            retry_in = max(0.0, settings.circuit_open_seconds - (time.monotonic() - self.opened_at))
+
+        return {
+            "state": self.state,
+            "failure_rate": self._outcomes.count(False) / outcomes if outcomes else 0.0,
+            "window": outcomes,
+            "retry_in": round(retry_in, 1),
+        }
+
+
+parse_breaker = CircuitBreaker("query_parse")
+chart_breaker = CircuitBreaker("chart_decision")
+insight_breaker = CircuitBreaker("cohort_insights")
+recommendation_breaker = CircuitBreaker("recommendations")
+
+circuit_breakers = {
+    breaker.name: breaker
+    for breaker in (parse_breaker, chart_breaker, insight_breaker, recommendation_breaker)
+}
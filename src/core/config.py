@@ -1,6 +1,6 @@
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 from pydantic_settings import BaseSettings
 from functools import lru_cache
 
@@ -25,6 +25,8 @@ class Settings(BaseSettings):
 
     embedding_model: str = "embedding-query"
     embedding_dimension: int = 4096
+    embedding_batch_window_ms: float = 5.0
+    embedding_batch_max_size: int = 32
 
     ai_module_root: Optional[str] = None
 
@@ -33,6 +35,85 @@ class Settings(BaseSettings):
     concordance_min: float = 0.60
     concordance_max: float = 0.95
 
+    search_cache_max_bytes: int = 64 * 1024 * 1024
+    panel_version_check_interval: float = 5.0
+    refine_cache_max_entries: int = 256
+    chart_decision_cache_max_entries: int = 512
+    recommendation_cache_max_members: int = 10000
+
+    history_batch_size: int = 100
+    history_flush_interval: float = 0.05
+    history_queue_size: int = 10000
+    history_id_block_size: int = 50
+    history_write_retries: int = 3
+    history_drain_timeout: float = 10.0
+    history_compact_storage: bool = False
+
+    member_profile_half_life_days: float = 14.0
+    member_profile_min_weight: float = 3.0
+    member_profile_prune_weight: float = 0.05
+    member_profile_top_values: int = 3
+    member_profile_flush_interval: float = 1.0
+    member_profile_flush_max_delay: float = 60.0
+    member_profile_max_members: int = 10000
+
+    feed_refresh_enabled: bool = True
+    feed_refresh_interval: float = 10.0
+    feed_refresh_debounce: float = 30.0
+    feed_refresh_concurrency: int = 4
+    feed_refresh_batch_size: int = 50
+    feed_max_age: float = 6 * 3600
+    feed_llm_budget_per_hour: int = 200
+    feed_size: int = 20
+
+    warmup_enabled: bool = True
+    warmup_industry_recommendations: bool = False
+    warmup_attempts: int = 3
+    warmup_retry_backoff: float = 2.0
+
+    compression_min_size: int = 1024
+    compression_zstd_level: int = 3
+    compression_gzip_level: int = 6
+
+    llm_initial_concurrency: int = 8
+    llm_min_concurrency: int = 1
+    llm_max_concurrency: int = 32
+    llm_requests_per_second: float = 10.0
+    llm_burst: int = 10
+    llm_queue_size: int = 100
+    llm_queue_timeout: float = 30.0
+    llm_latency_target: float = 15.0
+    llm_backoff_factor: float = 0.5
+
+    circuit_window_size: int = 20
+    circuit_min_calls: int = 10
+    circuit_failure_rate: float = 0.5
+    circuit_slow_call_seconds: float = 20.0
+    circuit_open_seconds: float = 30.0
+
+    parse_routing_enabled: bool = True
+    parse_complexity_threshold: int = 3
+
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 30.0
+    http_connect_timeout: float = 5.0
+    http_read_timeout: float = 60.0
+    http2_enabled: bool = True
+
+    request_budget_header: str = "x-request-timeout"
+    request_budget_default: float = 30.0
+    request_budget_max: float = 120.0
+    request_budgets: Dict[str, float] = {
+        "/api/search": 15.0,
+        "/api/cohort-comparison": 20.0,
+        "/api/quick-search": 10.0,
+    }
+    singleflight_max_budget: float = 30.0
+    insights_min_budget: float = 8.0
+    chart_llm_min_budget: float = 3.0
+    recommendation_llm_min_budget: float = 5.0
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -1,8 +1,12 @@
+import asyncio
 import asyncpg
+import orjson
 from typing import Optional, List, Any
 from contextlib import asynccontextmanager
 
+from . import deadline
 from .config import settings
+from .exceptions import DeadlineExceededError
 
 
 class Database:
@@ -15,9 +19,21 @@ class Database:
                 **settings.db_config,
                 min_size=settings.db_pool_min_size,
                 max_size=settings.db_pool_max_size,
+                init=cls._init_connection,
             )
         return cls._pool
 
+    @staticmethod
+    async def _init_connection(conn: asyncpg.Connection) -> None:
+        for typename in ("json", "jsonb"):
+            await conn.set_type_codec(
+                typename,
+                schema="pg_catalog",
+                encoder=lambda value: orjson.dumps(value).decode("utf-8"),
+                decoder=orjson.loads,
+                format="text",
+            )
+
     @classmethod
     async def close_pool(cls) -> None:
         if cls._pool is not None:
@@ -28,20 +44,35 @@ class Database:
     @asynccontextmanager
     async def connection(cls):
         pool = await cls.get_pool()
-        async with pool.acquire() as conn:
+        try:
+            conn = await pool.acquire(timeout=deadline.timeout(operation="database"))
+        except asyncio.TimeoutError:
+            raise DeadlineExceededError("database")
+        try:
             yield conn
+        finally:
+            await pool.release(conn)
 
     @classmethod
     async def fetch(cls, query: str, *args) -> List[asyncpg.Record]:
         async with cls.connection() as conn:
-            return await conn.fetch(query, *args)
+            try:
+                return await conn.fetch(query, *args, timeout=deadline.timeout(operation="database"))
+            except asyncio.TimeoutError:
+                raise DeadlineExceededError("database")
 
     @classmethod
     async def fetchrow(cls, query: str, *args) -> Optional[asyncpg.Record]:
         async with cls.connection() as conn:
-            return await conn.fetchrow(query, *args)
+            try:
+                return await conn.fetchrow(query, *args, timeout=deadline.timeout(operation="database"))
+            except asyncio.TimeoutError:
+                raise DeadlineExceededError("database")
 
     @classmethod
     async def execute(cls, query: str, *args) -> str:
         async with cls.connection() as conn:
-            return await conn.execute(query, *args)
+            try:
+                return await conn.execute(query, *args, timeout=deadline.timeout(operation="database"))
+            except asyncio.TimeoutError:
+                raise DeadlineExceededError("database")
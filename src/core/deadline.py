@@ -0,0 +1,48 @@
+import time
+from contextvars import ContextVar
+from typing import List, Optional
+
+from .exceptions import DeadlineExceededError
+
+
+_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+_skipped_stages: ContextVar[Optional[List[str]]] = ContextVar("skipped_stages", default=None)
+
+
+def start(budget: float) -> None:
+    _deadline.set(time.monotonic() + budget)
+    _skipped_stages.set([])
+
+
+def remaining() -> Optional[float]:
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def timeout(limit: Optional[float] = None, operation: str = "request") -> Optional[float]:
+    left = remaining()
+    if left is None:
+        return limit
+    if left <= 0:
+        raise DeadlineExceededError(operation)
+    return left if limit is None else min(limit, left)
+
+
+def allows(stage: str, required: float) -> bool:
+    left = remaining()
+    if left is None or left >= required:
+        return True
+    skip(stage)
+    return False
+
+
+def skip(stage: str) -> None:
+    stages = _skipped_stages.get()
+    if stages is not None and stage not in stages:
+        stages.append(stage)
+
+
+def skipped_stages() -> List[str]:
+    return list(_skipped_stages.get() or [])
@@ -46,6 +46,36 @@ class LLMError(PanelSearchException):
         )
 
 
+class LLMOverloadedError(PanelSearchException):
+    def __init__(self, model: str, reason: str):
+        super().__init__(
+            message=f"LLM capacity exceeded for {model}: {reason}",
+            code="LLM_OVERLOADED",
+            status_code=503,
+            details={"model": model, "reason": reason}
+        )
+
+
+class CircuitOpenError(PanelSearchException):
+    def __init__(self, operation: str):
+        super().__init__(
+            message=f"Circuit open for {operation}",
+            code="CIRCUIT_OPEN",
+            status_code=503,
+            details={"operation": operation}
+        )
+
+
+class DeadlineExceededError(PanelSearchException):
+    def __init__(self, operation: str):
+        super().__init__(
+            message=f"Request deadline exceeded during {operation}",
+            code="DEADLINE_EXCEEDED",
+            status_code=504,
+            details={"operation": operation}
+        )
+
+
 class NotFoundError(PanelSearchException):
     def __init__(self, resource: str, identifier: str):
         super().__init__(
@@ -0,0 +1,37 @@
+from collections import defaultdict
+from typing import Any, Dict
+
+
+class Metrics:
+    def __init__(self):
+        self._counters: Dict[str, float] = defaultdict(float)
+        self._timings: Dict[str, Dict[str, float]] = {}
+        self._gauges: Dict[str, Any] = {}
+
+    def increment(self, name: str, value: float = 1) -> None:
+        self._counters[name] += value
+
+    def observe(self, name: str, value: float) -> None:
+        timing = self._timings.get(name)
+        if timing is None:
+            self._timings[name] = {"count": 1, "sum": value, "max": value}
+            return
+        timing["count"] += 1
+        timing["sum"] += value
+        timing["max"] = max(timing["max"], value)
+
+    def set_gauge(self, name: str, value: Any) -> None:
+        self._gauges[name] = value
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "counters": dict(self._counters),
+            "timings": {
+                name: {**timing, "avg": timing["sum"] / timing["count"]}
+                for name, timing in self._timings.items()
+            },
+            "gauges": dict(self._gauges),
+        }
+
+
+metrics = Metrics()
@@ -0,0 +1,68 @@
+import asyncio
+import contextvars
+import hashlib
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+import orjson
+
+from . import deadline
+from .config import settings
+from .exceptions import DeadlineExceededError
+from .metrics import metrics
+
+
+T = TypeVar("T")
+
+
+def fingerprint(*parts: Any) -> str:
+    encoded = orjson.dumps(parts, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class SingleFlight:
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: Dict[str, asyncio.Future] = {}
+
+    async def do(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        clone: Optional[Callable[[T], T]] = None
+    ) -> T:
+        task = self._calls.get(key)
+        if task is None:
+            context = contextvars.Context()
+            context.run(deadline.start, self._budget())
+            task = asyncio.get_running_loop().create_task(fn(), context=context)
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+            metrics.increment(f"singleflight.{self.name}.executed")
+        else:
+            metrics.increment(f"singleflight.{self.name}.coalesced")
+
+        try:
+            result = await asyncio.wait_for(asyncio.shield(task), deadline.timeout(operation=self.name))
+        except asyncio.TimeoutError:
+            raise DeadlineExceededError(self.name)
+        return clone(result) if clone is not None else result
+
+    def _budget(self) -> float:
+        left = deadline.remaining()
+        if left is None:
+            return settings.singleflight_max_budget
+        return min(max(left, 0.0), settings.singleflight_max_budget)
+
+    def _finish(self, key: str, task: asyncio.Future) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()
+
+
+parse_flight = SingleFlight("query_parse")
+embedding_flight = SingleFlight("embedding")
+search_flight = SingleFlight("panel_search")
+chart_flight = SingleFlight("chart_decision")
+insight_flight = SingleFlight("cohort_insights")
+profile_flight = SingleFlight("member_profile")
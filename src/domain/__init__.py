@@ -1,4 +1,4 @@
-from .models import Panel, SearchFilter, Cohort, SearchHistory
+from .models import Panel, SearchFilter, Cohort, SearchHistory, MemberInterestProfile
 from .enums import SearchMode, Gender
 from .schemas import PanelProfileSchema, HashtagSchema
 
@@ -7,6 +7,7 @@ __all__ = [
     "SearchFilter",
     "Cohort",
     "SearchHistory",
+    "MemberInterestProfile",
     "SearchMode",
     "Gender",
     "PanelProfileSchema",
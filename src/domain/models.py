@@ -1,6 +1,6 @@
 from typing import Optional, List, Dict, Any, Union
 from pydantic import BaseModel, Field
-from datetime import date
+import datetime
 
 from .enums import SearchMode
 
@@ -75,4 +75,12 @@ class SearchHistory(BaseModel):
     content: str
     panel_ids: List[str] = []
     concordance_rate: List[float] = []
-    date: Optional[date] = None
+    panel_count: int = 0
+    date: Optional[datetime.date] = None
+
+
+class MemberInterestProfile(BaseModel):
+    member_id: int
+    counters: Dict[str, Dict[str, float]] = {}
+    search_count: int = 0
+    updated_at: float = 0.0
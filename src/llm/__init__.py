@@ -4,6 +4,8 @@ from .chart_decider import ChartDecider
 from .insight_generator import InsightGenerator
 from .embeddings import EmbeddingService
 from .profile_generator import ProfileGenerator
+from .limiter import llm_limiter, LLMPriority
+from .http_clients import http_clients
 
 __all__ = [
     "LLMClientFactory",
@@ -12,4 +14,7 @@ __all__ = [
     "InsightGenerator",
     "EmbeddingService",
     "ProfileGenerator",
+    "llm_limiter",
+    "LLMPriority",
+    "http_clients",
 ]
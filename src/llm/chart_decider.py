@@ -1,11 +1,15 @@
+from collections import OrderedDict
 from typing import Dict, Any, Tuple, Optional, List
 from pydantic import BaseModel, Field
 import json
-from langchain_core.prompts import PromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
 
+from src.core import deadline
+from src.core.circuit_breaker import chart_breaker
 from src.core.config import settings
-from .client import LLMClientFactory
+from src.core.metrics import metrics
+from src.core.singleflight import chart_flight, fingerprint
+from .client import LLMClientFactory, StructuredLLM
+from .prompts import STRUCTURED_OUTPUT_INSTRUCTION, CachedPrompt, load_prompt
 
 
 class SubChartInfo(BaseModel):
@@ -35,20 +39,26 @@ class ChartDecider:
         "education": "학력 분포",
     }
 
+    METRIC_PRIORITY_MAP = {
+        "brands": ("car_brand", 1, "차량 브랜드 분포"),
+        "occupation": ("occupation", 2, "직업 분포"),
+        "device_count_min": ("device_count", 3, "전자기기 보유 개수"),
+    }
+
     def __init__(self, use_llm: bool = True):
         self.use_llm = use_llm
+        self.max_cached_decisions = settings.chart_decision_cache_max_entries
+        self._decisions: "OrderedDict[Tuple, Tuple[str, str, str]]" = OrderedDict()
         if use_llm:
             self.llm = LLMClientFactory.create_sonnet(max_tokens=500)
-            self.parser = PydanticOutputParser(pydantic_object=ChartDecision)
+            self.structured = StructuredLLM(self.llm, ChartDecision, "chart_decision")
             self.prompt = self._create_prompt()
 
-    def _create_prompt(self) -> PromptTemplate:
-        prompt_path = settings.prompts_dir / "decide_main_chart.md"
-        template = prompt_path.read_text(encoding="utf-8")
-
-        return PromptTemplate(
-            template=template,
-            input_variables=["original_query", "query_filters", "cohort_stats_summary", "format_instructions"]
+    def _create_prompt(self) -> CachedPrompt:
+        return CachedPrompt.from_template(
+            load_prompt("decide_main_chart.md"),
+            ["original_query", "query_filters", "cohort_stats_summary"],
+            format_instructions=STRUCTURED_OUTPUT_INSTRUCTION
         )
 
     async def decide_main_chart(
@@ -58,12 +68,64 @@ class ChartDecider:
         cohort_stats: Dict[str, Any]
     ) -> Tuple[str, str, Optional[str]]:
         if not self.use_llm or not original_query:
-            return self._rule_based_decision(query_filter, cohort_stats)
+            return self._rule_decision(query_filter, cohort_stats, "llm_disabled")
+
+        if self._is_deterministic(query_filter, cohort_stats):
+            return self._rule_decision(query_filter, cohort_stats, "deterministic")
+
+        key = self._decision_key(query_filter, cohort_stats)
+        cached = self._decisions.get(key)
+        if cached is not None:
+            self._decisions.move_to_end(key)
+            metrics.increment("chart_decider.cache_hits")
+            return cached
+
+        if not deadline.allows("chart_llm", settings.chart_llm_min_budget):
+            return self._rule_decision(query_filter, cohort_stats, "deadline")
 
         try:
-            return await self._llm_based_decision(original_query, query_filter, cohort_stats)
+            decision = await chart_flight.do(
+                fingerprint(key),
+                lambda: chart_breaker.call(
+                    lambda: self._llm_based_decision(original_query, query_filter, cohort_stats)
+                )
+            )
         except Exception:
-            return self._rule_based_decision(query_filter, cohort_stats)
+            return self._rule_decision(query_filter, cohort_stats, "llm_failed")
+
+        metrics.increment("chart_decider.llm_decisions")
+        self._remember(key, decision)
+        return decision
+
+    def _rule_decision(
+        self,
+        query_filter: dict,
+        cohort_stats: Dict[str, Any],
+        reason: str
+    ) -> Tuple[str, str, str]:
+        metrics.increment("chart_decider.rule_decisions")
+        metrics.increment(f"chart_decider.rule_decisions.{reason}")
+        return self._rule_based_decision(query_filter, cohort_stats)
+
+    def _is_deterministic(self, query_filter: dict, cohort_stats: Dict[str, Any]) -> bool:
+        return any(
+            query_filter.get(field) is not None and bool(cohort_stats.get(metric))
+            for field, (metric, _, _) in self.METRIC_PRIORITY_MAP.items()
+        )
+
+    def _decision_key(self, query_filter: dict, cohort_stats: Dict[str, Any]) -> Tuple:
+        filter_keys = tuple(sorted(k for k, v in query_filter.items() if v is not None and k != 'limit'))
+        stats_shape = tuple(sorted(
+            (metric, len(data) if isinstance(data, (dict, list)) else 0)
+            for metric, data in cohort_stats.items()
+        ))
+        return filter_keys, stats_shape
+
+    def _remember(self, key: Tuple, decision: Tuple[str, str, str]) -> None:
+        self._decisions[key] = decision
+        self._decisions.move_to_end(key)
+        while len(self._decisions) > self.max_cached_decisions:
+            self._decisions.popitem(last=False)
 
     async def _llm_based_decision(
         self,
@@ -82,13 +144,12 @@ class ChartDecider:
                     "total": sum(data.values()) if all(isinstance(v, (int, float)) for v in data.values()) else None
                 }
 
-        chain = self.prompt | self.llm | self.parser
-        result = chain.invoke({
-            "original_query": original_query,
-            "query_filters": json.dumps(filters_summary, ensure_ascii=False, indent=2),
-            "cohort_stats_summary": json.dumps(stats_summary, ensure_ascii=False, indent=2),
-            "format_instructions": self.parser.get_format_instructions()
-        })
+        messages = self.prompt.messages(
+            original_query=original_query,
+            query_filters=json.dumps(filters_summary, ensure_ascii=False, indent=2),
+            cohort_stats_summary=json.dumps(stats_summary, ensure_ascii=False, indent=2)
+        )
+        result = await self.structured.ainvoke(messages)
 
         return result.main_metric, result.main_title, result.reasoning
 
@@ -97,12 +158,6 @@ class ChartDecider:
         query_filter: dict,
         cohort_stats: Dict[str, Any]
     ) -> Tuple[str, str, str]:
-        METRIC_PRIORITY_MAP = {
-            "brands": ("car_brand", 1, "차량 브랜드 분포"),
-            "occupation": ("occupation", 2, "직업 분포"),
-            "device_count_min": ("device_count", 3, "전자기기 보유 개수"),
-        }
-
         DEFAULT_PRIORITY = [
             ("occupation", "직업 분포"),
             ("marital_status", "결혼 여부"),
@@ -111,7 +166,7 @@ class ChartDecider:
             ("gender", "성별 분포")
         ]
 
-        for field, (metric, priority, title) in METRIC_PRIORITY_MAP.items():
+        for field, (metric, priority, title) in self.METRIC_PRIORITY_MAP.items():
             field_value = query_filter.get(field)
             if field_value is not None:
                 if metric in cohort_stats and cohort_stats[metric]:
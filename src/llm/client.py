@@ -1,7 +1,32 @@
+import asyncio
+import anthropic
 from langchain_anthropic import ChatAnthropic
-from functools import lru_cache
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from functools import cached_property, lru_cache
+from pydantic import BaseModel, ValidationError
+from typing import Any, AsyncIterator, Dict, Generic, List, Optional, Type, TypeVar
 
+from src.core import deadline
 from src.core.config import settings
+from src.core.exceptions import DeadlineExceededError, LLMError
+from src.core.metrics import metrics
+from .http_clients import http_clients
+from .limiter import llm_limiter, LLMPriority
+
+
+T = TypeVar("T", bound=BaseModel)
+
+ANTHROPIC_BASE_URL = "https://anthropic.hconeai.com/"
+
+
+class PooledChatAnthropic(ChatAnthropic):
+    @cached_property
+    def _client(self) -> anthropic.Client:
+        return anthropic.Client(**self._client_params, http_client=http_clients.sync_client("anthropic"))
+
+    @cached_property
+    def _async_client(self) -> anthropic.AsyncClient:
+        return anthropic.AsyncClient(**self._client_params, http_client=http_clients.async_client("anthropic"))
 
 
 class LLMClientFactory:
@@ -25,10 +50,10 @@ class LLMClientFactory:
         else:
             headers["Helicone-Cache-Enabled"] = "false"
 
-        return ChatAnthropic(
+        return PooledChatAnthropic(
             model=model,
             anthropic_api_key=settings.anthropic_api_key,
-            base_url="https://anthropic.hconeai.com/",
+            base_url=ANTHROPIC_BASE_URL,
             temperature=temperature,
             max_tokens=max_tokens,
             default_headers=headers
@@ -49,3 +74,73 @@ class LLMClientFactory:
             temperature=temperature,
             max_tokens=max_tokens
         )
+
+
+def record_usage(operation: str, message: AIMessage) -> None:
+    usage = getattr(message, "usage_metadata", None) or {}
+    details = usage.get("input_token_details") or {}
+
+    metrics.increment(f"llm.{operation}.calls")
+    metrics.increment(f"llm.{operation}.input_tokens", usage.get("input_tokens", 0))
+    metrics.increment(f"llm.{operation}.output_tokens", usage.get("output_tokens", 0))
+    metrics.increment(f"llm.{operation}.cache_read_tokens", details.get("cache_read") or 0)
+    metrics.increment(f"llm.{operation}.cache_creation_tokens", details.get("cache_creation") or 0)
+
+
+class StructuredLLM(Generic[T]):
+    def __init__(self, llm: ChatAnthropic, schema: Type[T], operation: str):
+        self.model = llm.model
+        self.schema = schema
+        self.operation = operation
+        self.runnable = llm.with_structured_output(schema, include_raw=True)
+        self.tool_llm = llm.bind_tools([schema], tool_choice=schema.__name__)
+
+    async def ainvoke(
+        self,
+        messages: List[BaseMessage],
+        priority: LLMPriority = LLMPriority.INTERACTIVE
+    ) -> T:
+        result = await llm_limiter.run(self.model, lambda: self.runnable.ainvoke(messages), priority)
+        return self._unwrap(result)
+
+    async def astream(
+        self,
+        messages: List[BaseMessage],
+        priority: LLMPriority = LLMPriority.INTERACTIVE
+    ) -> AsyncIterator[Dict[str, Any]]:
+        async with llm_limiter.slot(self.model, priority):
+            message: Optional[AIMessageChunk] = None
+            stream = self.tool_llm.astream(messages).__aiter__()
+            try:
+                while True:
+                    try:
+                        chunk = await asyncio.wait_for(stream.__anext__(), deadline.timeout(operation="llm"))
+                    except StopAsyncIteration:
+                        break
+                    except asyncio.TimeoutError:
+                        raise DeadlineExceededError("llm")
+
+                    message = chunk if message is None else message + chunk
+                    if message.tool_calls:
+                        yield message.tool_calls[0]["args"]
+            finally:
+                await stream.aclose()
+                if message is not None:
+                    record_usage(self.operation, message)
+
+    def parse(self, args: Dict[str, Any]) -> T:
+        try:
+            return self.schema.model_validate(args)
+        except ValidationError as e:
+            metrics.increment(f"llm.{self.operation}.schema_failures")
+            raise LLMError(self.operation, f"{self.schema.__name__} schema validation failed: {e}")
+
+    def _unwrap(self, result: Dict[str, Any]) -> T:
+        record_usage(self.operation, result["raw"])
+
+        parsed = result.get("parsed")
+        if result.get("parsing_error") is not None or not isinstance(parsed, self.schema):
+            metrics.increment(f"llm.{self.operation}.schema_failures")
+            raise LLMError(self.operation, f"{self.schema.__name__} schema validation failed: {result.get('parsing_error')}")
+
+        return parsed
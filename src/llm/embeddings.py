@@ -1,7 +1,74 @@
-from typing import List
+import asyncio
+from typing import Callable, List, Optional, Set, Tuple
 from langchain_upstage import UpstageEmbeddings
 
 from src.core.config import settings
+from src.core.metrics import metrics
+from .http_clients import http_clients
+
+
+class EmbeddingBatcher:
+    def __init__(
+        self,
+        embed_texts: Callable[[List[str]], List[List[float]]],
+        window_ms: float,
+        max_batch: int
+    ):
+        self._embed_texts = embed_texts
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def embed(self, text: str) -> List[float]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.ensure_future(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        texts = list(dict.fromkeys(text for text, _ in batch))
+        metrics.increment("embedding.batches")
+        metrics.increment("embedding.batched_texts", len(batch))
+
+        try:
+            vectors = await asyncio.to_thread(self._embed_texts, texts)
+            if len(vectors) != len(texts):
+                raise ValueError(f"expected {len(texts)} embeddings, got {len(vectors)}")
+
+            by_text = dict(zip(texts, vectors))
+            for text, future in batch:
+                if not future.done():
+                    future.set_result(list(by_text[text]))
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            metrics.increment("embedding.batch_failures")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
 
 
 class EmbeddingService:
@@ -22,7 +89,14 @@ class EmbeddingService:
 
         self.embedder = UpstageEmbeddings(
             api_key=settings.upstage_api_key,
-            model=settings.embedding_model
+            model=settings.embedding_model,
+            http_client=http_clients.sync_client("upstage"),
+            http_async_client=http_clients.async_client("upstage")
+        )
+        self.batcher = EmbeddingBatcher(
+            self.embed_texts,
+            window_ms=settings.embedding_batch_window_ms,
+            max_batch=settings.embedding_batch_max_size
         )
         self._initialized = True
 
@@ -32,6 +106,11 @@ class EmbeddingService:
     def embed_texts(self, texts: List[str]) -> List[List[float]]:
         return self.embedder.embed_documents(texts)
 
+    async def aembed_text(self, text: str) -> List[float]:
+        if settings.embedding_batch_window_ms <= 0:
+            return await asyncio.to_thread(self.embed_text, text)
+        return await self.batcher.embed(text)
+
     @property
     def dimension(self) -> int:
         return settings.embedding_dimension
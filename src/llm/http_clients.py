@@ -0,0 +1,90 @@
+import asyncio
+import importlib.util
+from typing import Any, Dict
+
+import httpx
+
+from src.core.config import settings
+from src.core.metrics import metrics
+
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class HTTPClients:
+    def __init__(self):
+        self._sync: Dict[str, httpx.Client] = {}
+        self._async: Dict[str, httpx.AsyncClient] = {}
+
+    def sync_client(self, name: str) -> httpx.Client:
+        client = self._sync.get(name)
+        if client is None or client.is_closed:
+            client = httpx.Client(
+                **self._client_options(),
+                event_hooks={"request": [self._sync_request_hook(name)]}
+            )
+            self._sync[name] = client
+        return client
+
+    def async_client(self, name: str) -> httpx.AsyncClient:
+        client = self._async.get(name)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                **self._client_options(),
+                event_hooks={"request": [self._async_request_hook(name)]}
+            )
+            self._async[name] = client
+        return client
+
+    async def preconnect(self, name: str, url: str) -> int:
+        response = await self.async_client(name).head(url)
+        await asyncio.to_thread(self.sync_client(name).head, url)
+        return response.status_code
+
+    async def aclose(self) -> None:
+        for client in self._async.values():
+            await client.aclose()
+        for client in self._sync.values():
+            client.close()
+        self._async.clear()
+        self._sync.clear()
+
+    def _client_options(self) -> Dict[str, Any]:
+        return {
+            "http2": settings.http2_enabled and HTTP2_AVAILABLE,
+            "limits": httpx.Limits(
+                max_connections=settings.http_max_connections,
+                max_keepalive_connections=settings.http_max_keepalive_connections,
+                keepalive_expiry=settings.http_keepalive_expiry,
+            ),
+            "timeout": httpx.Timeout(settings.http_read_timeout, connect=settings.http_connect_timeout),
+        }
+
+    def _sync_request_hook(self, name: str):
+        def trace(event: str, info: dict) -> None:
+            self._record_trace(name, event)
+
+        def hook(request: httpx.Request) -> None:
+            metrics.increment(f"http.{name}.requests")
+            request.extensions["trace"] = trace
+
+        return hook
+
+    def _async_request_hook(self, name: str):
+        async def trace(event: str, info: dict) -> None:
+            self._record_trace(name, event)
+
+        async def hook(request: httpx.Request) -> None:
+            metrics.increment(f"http.{name}.requests")
+            request.extensions["trace"] = trace
+
+        return hook
+
+    def _record_trace(self, name: str, event: str) -> None:
+        if event == "connection.connect_tcp.complete":
+            metrics.increment(f"http.{name}.connections_opened")
+        elif event == "connection.start_tls.complete":
+            metrics.increment(f"http.{name}.tls_handshakes")
+
+
+http_clients = HTTPClients()
@@ -1,11 +1,14 @@
-from typing import Dict, Any, Optional, List
+from typing import AsyncIterator, Dict, Any, Optional, List, Tuple
 from pydantic import BaseModel, Field
 import json
-from langchain_core.prompts import PromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.messages import BaseMessage
 
 from src.core.config import settings
-from .client import LLMClientFactory
+from src.core.circuit_breaker import insight_breaker
+from src.core.singleflight import insight_flight, fingerprint
+from .client import LLMClientFactory, StructuredLLM
+from .limiter import LLMPriority
+from .prompts import STRUCTURED_OUTPUT_INSTRUCTION, CachedPrompt, dynamic_marker, load_prompt
 
 
 class KeyInsights(BaseModel):
@@ -39,6 +42,32 @@ class RecommendationList(BaseModel):
 class InsightGenerator:
     def __init__(self):
         self.llm = LLMClientFactory.create_sonnet(temperature=0.3)
+        self.insights_llm = StructuredLLM(self.llm, KeyInsights, "cohort_insights")
+        self.patterns_llm = StructuredLLM(
+            LLMClientFactory.create_haiku(max_tokens=2000), ExtractedPatterns, "extract_patterns"
+        )
+        self.recommendations_llm = StructuredLLM(self.llm, RecommendationList, "recommendations")
+        self.cohort_insights_prompt = self._create_cohort_insights_prompt()
+        self.patterns_prompt = CachedPrompt.from_template(
+            load_prompt("extract_patterns.md"),
+            ["search_history"],
+            format_instructions=STRUCTURED_OUTPUT_INSTRUCTION
+        )
+        self.recommendations_prompt = CachedPrompt.from_template(
+            load_prompt("generate_personalized_recommendations.md"),
+            ["search_history", "patterns"],
+            format_instructions=STRUCTURED_OUTPUT_INSTRUCTION
+        )
+
+    def _create_cohort_insights_prompt(self) -> Optional[CachedPrompt]:
+        if not (settings.prompts_dir / "analyze_cohort_insights.md").exists():
+            return None
+
+        prompt_template_str = load_prompt("analyze_cohort_insights.md")
+        return CachedPrompt(
+            prompt_template_str.replace("{input_json}", dynamic_marker("input_json")),
+            ["input_json"]
+        )
 
     async def generate_cohort_insights(
         self,
@@ -56,45 +85,61 @@ class InsightGenerator:
             "characteristics": characteristics
         }
 
-        prompt_path = settings.prompts_dir / "analyze_cohort_insights.md"
-        if not prompt_path.exists():
+        if self.cohort_insights_prompt is None:
             return None
 
-        prompt_template_str = prompt_path.read_text(encoding="utf-8")
-        escaped_prompt = prompt_template_str.replace("{", "{{").replace("}", "}}")
+        messages = self._cohort_insights_messages(input_data)
 
-        prompt_template = PromptTemplate(
-            template=escaped_prompt + "\n\n{input_json}\n\n",
-            input_variables=["input_json"]
+        return await insight_flight.do(
+            fingerprint(input_data),
+            lambda: insight_breaker.call(lambda: self._generate_cohort_insights(messages)),
+            clone=lambda insights: insights.model_copy()
         )
 
-        parser = PydanticOutputParser(pydantic_object=KeyInsights)
-        chain = prompt_template | self.llm | parser
+    async def stream_cohort_insights(
+        self,
+        cohort_1_info: dict,
+        cohort_2_info: dict,
+        comparisons: List[dict],
+        basic_info: List[dict],
+        characteristics: List[dict]
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        if self.cohort_insights_prompt is None:
+            return
 
-        result = await chain.ainvoke({
-            "input_json": json.dumps(input_data, ensure_ascii=False, indent=2)
+        messages = self._cohort_insights_messages({
+            "cohort_1": cohort_1_info,
+            "cohort_2": cohort_2_info,
+            "comparisons": comparisons,
+            "basic_info": basic_info,
+            "characteristics": characteristics
         })
 
-        return result
-
-    def extract_patterns(self, queries: List[str]) -> Dict[str, Any]:
-        prompt_path = settings.prompts_dir / "extract_patterns.md"
-        template = prompt_path.read_text(encoding="utf-8")
-
-        prompt = PromptTemplate(
-            template=template,
-            input_variables=["search_history", "format_instructions"]
+        emitted = {field: "" for field in KeyInsights.model_fields}
+        args: Dict[str, Any] = {}
+        async with insight_breaker.guard():
+            async for args in self.insights_llm.astream(messages):
+                for field, text in emitted.items():
+                    value = args.get(field)
+                    if isinstance(value, str) and len(value) > len(text) and value.startswith(text):
+                        emitted[field] = value
+                        yield "insight_delta", {"field": field, "delta": value[len(text):]}
+
+        yield "key_insights", self.insights_llm.parse(args)
+
+    def _cohort_insights_messages(self, input_data: dict) -> List[BaseMessage]:
+        return self.cohort_insights_prompt.messages(
+            input_json=json.dumps(input_data, ensure_ascii=False, indent=2)
         )
 
-        parser = PydanticOutputParser(pydantic_object=ExtractedPatterns)
-        llm = LLMClientFactory.create_haiku(max_tokens=2000)
-        chain = prompt | llm | parser
+    async def _generate_cohort_insights(self, messages: List[BaseMessage]) -> KeyInsights:
+        return await self.insights_llm.ainvoke(messages)
 
+    async def extract_patterns(self, queries: List[str]) -> Dict[str, Any]:
         history_str = "\n".join([f"- {q}" for q in queries])
-        result = chain.invoke({
-            "search_history": history_str,
-            "format_instructions": parser.get_format_instructions()
-        })
+        result = await self.patterns_llm.ainvoke(
+            self.patterns_prompt.messages(search_history=history_str), LLMPriority.BACKGROUND
+        )
 
         patterns = {}
         for category in ['demographic', 'occupation', 'brand', 'survey_health', 'survey_digital', 'survey_lifestyle', 'survey_consumption']:
@@ -104,30 +149,18 @@ class InsightGenerator:
 
         return patterns
 
-    def generate_recommendations(
+    async def generate_recommendations(
         self,
         search_history: List[str],
         patterns: Dict[str, List[str]]
     ) -> List[Dict[str, Any]]:
-        prompt_path = settings.prompts_dir / "generate_personalized_recommendations.md"
-        template = prompt_path.read_text(encoding="utf-8")
-
-        prompt = PromptTemplate(
-            template=template,
-            input_variables=["search_history", "patterns", "format_instructions"]
-        )
-
-        parser = PydanticOutputParser(pydantic_object=RecommendationList)
-        chain = prompt | self.llm | parser
-
         history_str = "\n".join([f"- {q}" for q in search_history])
         patterns_str = "\n".join([f"- {k}: {', '.join(v)}" for k, v in patterns.items()])
 
-        result = chain.invoke({
-            "search_history": history_str,
-            "patterns": patterns_str,
-            "format_instructions": parser.get_format_instructions()
-        })
+        result = await self.recommendations_llm.ainvoke(
+            self.recommendations_prompt.messages(search_history=history_str, patterns=patterns_str),
+            LLMPriority.BACKGROUND
+        )
 
         recommendations = []
         for rec in result.recommendations:
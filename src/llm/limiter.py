@@ -0,0 +1,197 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import AsyncIterator, Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+from src.core import deadline
+from src.core.config import settings
+from src.core.exceptions import DeadlineExceededError, LLMOverloadedError
+from src.core.metrics import metrics
+
+
+T = TypeVar("T")
+
+THROTTLED_STATUS_CODES = {429, 529}
+
+
+class LLMPriority(IntEnum):
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+class ModelLimiter:
+    def __init__(self, model: str):
+        self.model = model
+        self.max_rate = settings.llm_requests_per_second
+        self.min_rate = self.max_rate / 10
+        self.limit = float(settings.llm_initial_concurrency)
+        self.rate = self.max_rate
+        self.tokens = float(settings.llm_burst)
+        self.refilled_at = time.monotonic()
+        self.in_flight = 0
+        self.lanes: Dict[LLMPriority, Deque[asyncio.Future]] = {
+            priority: deque() for priority in LLMPriority
+        }
+        self._wakeup: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def queued(self) -> int:
+        return sum(len(lane) for lane in self.lanes.values())
+
+    async def acquire(self, priority: LLMPriority) -> None:
+        if not self.queued and self._try_admit():
+            self._publish()
+            return
+
+        if self.queued >= settings.llm_queue_size:
+            metrics.increment(f"llm.{self.model}.rejected")
+            raise LLMOverloadedError(self.model, "wait queue is full")
+
+        wait_timeout = deadline.timeout(settings.llm_queue_timeout, operation="llm")
+        future = asyncio.get_running_loop().create_future()
+        lane = self.lanes[priority]
+        lane.append(future)
+        metrics.increment(f"llm.{self.model}.queued")
+        if self._wakeup is None:
+            self._dispatch()
+        else:
+            self._publish()
+
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(future, wait_timeout)
+        except asyncio.TimeoutError:
+            self._abandon(lane, future)
+            metrics.increment(f"llm.{self.model}.queue_timeouts")
+            raise LLMOverloadedError(self.model, "timed out waiting for capacity")
+        except asyncio.CancelledError:
+            self._abandon(lane, future)
+            raise
+        finally:
+            metrics.observe(f"llm.{self.model}.queue_wait", time.monotonic() - started)
+
+    def release(self, elapsed: float, throttled: bool) -> None:
+        self.in_flight -= 1
+
+        if throttled:
+            metrics.increment(f"llm.{self.model}.throttled")
+            self.limit = max(settings.llm_min_concurrency, self.limit * settings.llm_backoff_factor)
+            self.rate = max(self.min_rate, self.rate * settings.llm_backoff_factor)
+        elif elapsed > settings.llm_latency_target:
+            metrics.increment(f"llm.{self.model}.slow")
+            self.limit = max(settings.llm_min_concurrency, self.limit * settings.llm_backoff_factor)
+        else:
+            self.limit = min(settings.llm_max_concurrency, self.limit + 1 / self.limit)
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+        metrics.observe(f"llm.{self.model}.latency", elapsed)
+        self._dispatch()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(settings.llm_burst, self.tokens + (now - self.refilled_at) * self.rate)
+        self.refilled_at = now
+
+    def _try_admit(self) -> bool:
+        if self.in_flight >= int(self.limit):
+            return False
+
+        self._refill()
+        if self.tokens < 1:
+            return False
+
+        self.tokens -= 1
+        self.in_flight += 1
+        return True
+
+    def _dispatch(self) -> None:
+        self._wakeup = None
+
+        for priority in LLMPriority:
+            lane = self.lanes[priority]
+            while lane:
+                if lane[0].done():
+                    lane.popleft()
+                    continue
+
+                if not self._try_admit():
+                    self._schedule_refill()
+                    self._publish()
+                    return
+
+                lane.popleft().set_result(None)
+
+        self._publish()
+
+    def _schedule_refill(self) -> None:
+        if self._wakeup is not None or self.in_flight >= int(self.limit):
+            return
+
+        delay = (1 - self.tokens) / self.rate
+        self._wakeup = asyncio.get_running_loop().call_later(delay, self._dispatch)
+
+    def _abandon(self, lane: Deque[asyncio.Future], future: asyncio.Future) -> None:
+        if future.done() and not future.cancelled():
+            self.in_flight -= 1
+            self._dispatch()
+            return
+
+        try:
+            lane.remove(future)
+        except ValueError:
+            pass
+        self._publish()
+
+    def _publish(self) -> None:
+        metrics.set_gauge(f"llm.{self.model}.limit", round(self.limit, 2))
+        metrics.set_gauge(f"llm.{self.model}.rate", round(self.rate, 2))
+        metrics.set_gauge(f"llm.{self.model}.in_flight", self.in_flight)
+        metrics.set_gauge(f"llm.{self.model}.queue_depth", self.queued)
+
+
+class LLMLimiter:
+    def __init__(self):
+        self._models: Dict[str, ModelLimiter] = {}
+
+    def for_model(self, model: str) -> ModelLimiter:
+        limiter = self._models.get(model)
+        if limiter is None:
+            limiter = ModelLimiter(model)
+            self._models[model] = limiter
+        return limiter
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        model: str,
+        priority: LLMPriority = LLMPriority.INTERACTIVE
+    ) -> AsyncIterator[None]:
+        limiter = self.for_model(model)
+        await limiter.acquire(priority)
+
+        started = time.monotonic()
+        throttled = False
+        try:
+            yield
+        except Exception as e:
+            throttled = getattr(e, "status_code", None) in THROTTLED_STATUS_CODES
+            raise
+        finally:
+            limiter.release(time.monotonic() - started, throttled)
+
+    async def run(
+        self,
+        model: str,
+        fn: Callable[[], Awaitable[T]],
+        priority: LLMPriority = LLMPriority.INTERACTIVE
+    ) -> T:
+        async with self.slot(model, priority):
+            try:
+                return await asyncio.wait_for(fn(), deadline.timeout(operation="llm"))
+            except asyncio.TimeoutError:
+                raise DeadlineExceededError("llm")
+
+
+llm_limiter = LLMLimiter()
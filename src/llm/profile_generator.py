@@ -1,11 +1,11 @@
 import json
 from typing import Dict, Any
-from langchain_core.prompts import PromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
 
 from src.core.config import settings
 from src.domain.schemas import PanelProfileSchema, HashtagSchema
-from src.llm.client import LLMClientFactory
+from src.llm.client import LLMClientFactory, StructuredLLM
+from src.llm.limiter import LLMPriority
+from src.llm.prompts import STRUCTURED_OUTPUT_INSTRUCTION, CachedPrompt, dynamic_marker, load_prompt
 
 
 class ProfileGenerator:
@@ -16,61 +16,44 @@ class ProfileGenerator:
         self.llm = LLMClientFactory.create_haiku(max_tokens=2000)
         self.llm_hashtag = LLMClientFactory.create_haiku(max_tokens=1000)
 
-        self.profile_parser = PydanticOutputParser(pydantic_object=PanelProfileSchema)
-        self.hashtag_parser = PydanticOutputParser(pydantic_object=HashtagSchema)
+        self.profile_llm = StructuredLLM(self.llm, PanelProfileSchema, "panel_profile")
+        self.hashtag_llm = StructuredLLM(self.llm_hashtag, HashtagSchema, "panel_hashtags")
 
         self.profile_prompt = self._create_profile_prompt()
         self.hashtag_prompt = self._create_hashtag_prompt()
 
-        self.profile_chain = self.profile_prompt | self.llm | self.profile_parser
-        self.hashtag_chain = self.hashtag_prompt | self.llm_hashtag | self.hashtag_parser
-
     def _load_prompt_file(self, filename: str) -> str:
-        prompt_path = settings.prompts_dir / filename
-        with open(prompt_path, 'r', encoding='utf-8') as f:
-            return f.read()
+        return load_prompt(filename)
 
-    def _create_profile_prompt(self) -> PromptTemplate:
+    def _create_profile_prompt(self) -> CachedPrompt:
         if self.custom_prompt_path:
             with open(self.custom_prompt_path, 'r', encoding='utf-8') as f:
                 base_prompt = f.read()
         else:
             base_prompt = self._load_prompt_file("generate_profile.md")
 
-        template = f"""{base_prompt}
+        system_text = f"""{base_prompt.format()}
 
 # INPUT DATA
-```json
-{{panel_data}}
-```
-
-{{format_instructions}}
+{dynamic_marker("panel_data")}
 
+{STRUCTURED_OUTPUT_INSTRUCTION}
 """
 
-        return PromptTemplate(
-            template=template,
-            input_variables=["panel_data", "format_instructions"]
-        ).partial(format_instructions=self.profile_parser.get_format_instructions())
+        return CachedPrompt(system_text, ["panel_data"])
 
-    def _create_hashtag_prompt(self) -> PromptTemplate:
+    def _create_hashtag_prompt(self) -> CachedPrompt:
         base_prompt = self._load_prompt_file("generate_hashtags.md")
 
-        template = f"""{base_prompt}
+        system_text = f"""{base_prompt.format()}
 
 # INPUT DATA
-```json
-{{hashtag_input}}
-```
-
-{{format_instructions}}
+{dynamic_marker("hashtag_input")}
 
+{STRUCTURED_OUTPUT_INSTRUCTION}
 """
 
-        return PromptTemplate(
-            template=template,
-            input_variables=["hashtag_input", "format_instructions"]
-        ).partial(format_instructions=self.hashtag_parser.get_format_instructions())
+        return CachedPrompt(system_text, ["hashtag_input"])
 
     def _prepare_input_data(self, panel: dict) -> dict:
         input_data = {
@@ -102,25 +85,41 @@ class ProfileGenerator:
 
         return {k: v for k, v in input_data.items() if not is_empty(v)}
 
-    def generate_profile(self, panel: dict) -> Dict[str, Any]:
+    async def agenerate_profile(self, panel: dict) -> Dict[str, Any]:
         input_data = self._prepare_input_data(panel)
         panel_json = json.dumps(input_data, ensure_ascii=False, indent=2)
 
         try:
-            validated_profile = self.profile_chain.invoke({"panel_data": panel_json})
+            validated_profile = await self.profile_llm.ainvoke(
+                self.profile_prompt.messages(panel_data=panel_json), LLMPriority.BACKGROUND
+            )
+        except Exception as e:
+            raise ValueError(f"프로필 생성 실패: {e}")
+
+        return self._build_profile_result(panel, input_data, validated_profile)
+
+    def _build_profile_result(self, panel: dict, input_data: dict, validated_profile) -> Dict[str, Any]:
+        return {
+            "panel_id": panel.get("panel_id"),
+            "profile": validated_profile.model_dump(),
+            "model": settings.model_haiku,
+            "temperature": 0,
+            "input_data": input_data
+        }
+
+    async def agenerate_hashtags(self, profile: dict, raw_data: dict) -> Dict[str, Any]:
+        input_json = self._prepare_hashtag_input(profile, raw_data)
 
-            return {
-                "panel_id": panel.get("panel_id"),
-                "profile": validated_profile.model_dump(),
-                "model": settings.model_haiku,
-                "temperature": 0,
-                "input_data": input_data
-            }
+        try:
+            validated_hashtags = await self.hashtag_llm.ainvoke(
+                self.hashtag_prompt.messages(hashtag_input=input_json), LLMPriority.BACKGROUND
+            )
+            return validated_hashtags.model_dump()
 
         except Exception as e:
-            raise ValueError(f"프로필 생성 실패: {e}")
+            raise ValueError(f"해시태그 생성 실패: {e}")
 
-    def generate_hashtags(self, profile: dict, raw_data: dict) -> Dict[str, Any]:
+    def _prepare_hashtag_input(self, profile: dict, raw_data: dict) -> str:
         devices = raw_data.get("보유전자제품", [])
         device_count = len(devices) if devices else 0
 
@@ -136,11 +135,4 @@ class ProfileGenerator:
             "devices": devices
         }
 
-        input_json = json.dumps(input_data, ensure_ascii=False, indent=2)
-
-        try:
-            validated_hashtags = self.hashtag_chain.invoke({"hashtag_input": input_json})
-            return validated_hashtags.model_dump()
-
-        except Exception as e:
-            raise ValueError(f"해시태그 생성 실패: {e}")
+        return json.dumps(input_data, ensure_ascii=False, indent=2)
@@ -0,0 +1,46 @@
+from functools import lru_cache
+from typing import Any, List
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+
+from src.core.config import settings
+
+
+@lru_cache(maxsize=None)
+def load_prompt(filename: str) -> str:
+    prompt_path = settings.prompts_dir / filename
+    return prompt_path.read_text(encoding="utf-8")
+
+
+def preload_prompts() -> List[str]:
+    filenames = sorted(path.name for path in settings.prompts_dir.glob("*.md"))
+    for filename in filenames:
+        load_prompt(filename)
+    return filenames
+
+
+STRUCTURED_OUTPUT_INSTRUCTION = "응답은 제공된 도구의 입력 스키마에 맞춰 도구 호출로만 반환하세요."
+
+
+def dynamic_marker(name: str) -> str:
+    return f"(사용자 메시지의 `## {name}` 섹션 참조)"
+
+
+class CachedPrompt:
+    def __init__(self, system_text: str, dynamic: List[str]):
+        self.system_text = system_text
+        self.dynamic = dynamic
+
+    @classmethod
+    def from_template(cls, template: str, dynamic: List[str], **static_values: str) -> "CachedPrompt":
+        markers = {name: dynamic_marker(name) for name in dynamic}
+        return cls(template.format(**markers, **static_values), dynamic)
+
+    def messages(self, **values: Any) -> List[BaseMessage]:
+        return [
+            SystemMessage(content=[{
+                "type": "text",
+                "text": self.system_text,
+                "cache_control": {"type": "ephemeral"},
+            }]),
+            HumanMessage(content="\n\n".join(f"## {name}\n{values[name]}" for name in self.dynamic)),
+        ]
@@ -1,12 +1,17 @@
-import json
-from typing import Dict, Any, List
+import copy
+import re
+import time
+from typing import Dict, Any, List, Optional
 from pydantic import BaseModel, Field
-from langchain_core.prompts import PromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
 
+from src.core.circuit_breaker import parse_breaker
 from src.core.config import settings
+from src.core.exceptions import CircuitOpenError, LLMError
+from src.core.metrics import metrics
+from src.core.singleflight import parse_flight, fingerprint
 from src.domain.enums import SearchMode
-from .client import LLMClientFactory
+from .client import LLMClientFactory, StructuredLLM
+from .prompts import STRUCTURED_OUTPUT_INSTRUCTION, CachedPrompt, load_prompt
 
 
 class QueryFilter(BaseModel):
@@ -30,6 +35,10 @@ class QueryFilter(BaseModel):
     survey_digital: Dict[str, Any] = Field(default=None)
 
 
+class ParsedQuery(QueryFilter):
+    conditions: List[QueryFilter] = Field(default=None)
+
+
 FREQUENCY_EXPANSION_MAP = {
     "혼밥빈도": {
         "high": ["거의 매일", "주 2~3회"],
@@ -63,75 +72,129 @@ class QueryParser:
         "여": "FEMALE"
     }
 
+    COMPLEXITY_MARKERS = [',', '각각', '그리고', '및 ', '씩', '중에', '이면서', '제외']
+
+    SURVEY_TERMS = [
+        "OTT", "넷플릭스", "전통시장", "배송", "선물", "지출", "포인트", "반려", "여행", "방학",
+        "스트레스", "혼밥", "알람", "물놀이", "패션", "사진", "이사", "운동", "흡연", "담배",
+        "음주", "건강", "ChatGPT", "챗GPT", "AI", "챗봇", "환경", "쇼핑"
+    ]
+
     def __init__(self):
         self.llm = LLMClientFactory.create_sonnet()
-        self.parser = PydanticOutputParser(pydantic_object=QueryFilter)
+        self.fast_llm = LLMClientFactory.create_haiku()
+        self.structured = StructuredLLM(self.llm, ParsedQuery, "query_parse_sonnet")
+        self.fast_structured = StructuredLLM(self.fast_llm, ParsedQuery, "query_parse_haiku")
         self.prompt = self._create_prompt()
 
-    def _create_prompt(self) -> PromptTemplate:
-        prompt_path = settings.prompts_dir / "parse_query.md"
-        with open(prompt_path, 'r', encoding='utf-8') as f:
-            base_prompt = f.read()
-
-        template = f"""{base_prompt}
+    def _create_prompt(self) -> CachedPrompt:
+        base_prompt = load_prompt("parse_query.md").format()
 
-# USER QUERY
-```
-{{query}}
-```
+        system_text = f"""{base_prompt}
 
-구조화된 필터를 JSON 형식으로 출력하세요. OUTPUT SCHEMA 형식을 정확히 따르세요.
+{STRUCTURED_OUTPUT_INSTRUCTION} 필드 의미는 OUTPUT SCHEMA 설명을 따르세요.
+단일 그룹이면 필터 객체 하나를, 서로 다른 그룹을 동시에 검색하면 `conditions` 배열을 가진 객체 하나를 출력하세요.
 """
 
-        return PromptTemplate(
-            template=template,
-            input_variables=["query"]
+        return CachedPrompt(system_text, ["query"])
+
+    REGION_KEYWORDS = [
+        "서울", "경기", "인천", "부산", "대구", "광주", "대전", "울산", "세종",
+        "강원", "충북", "충남", "전북", "전남", "경북", "경남", "제주"
+    ]
+
+    async def aparse(self, query: str) -> ParsedQuery:
+        if self._is_simple(query):
+            started = time.monotonic()
+            try:
+                parsed = await self.fast_structured.ainvoke(self.prompt.messages(query=query))
+            except LLMError:
+                parsed = None
+            if self._accept_fast_result(parsed, started):
+                return parsed
+
+        started = time.monotonic()
+        parsed = await self.structured.ainvoke(self.prompt.messages(query=query))
+        self._record_tier("sonnet", started)
+        return parsed
+
+    def _complexity(self, query: str) -> int:
+        score = len(query) // 30
+        score += 2 * sum(query.count(marker) for marker in self.COMPLEXITY_MARKERS)
+        score += 2 * sum(1 for term in self.SURVEY_TERMS if term in query)
+        score += sum(1 for keywords in FREQUENCY_KEYWORDS.values() for kw in keywords if kw in query)
+        return score
+
+    def _is_simple(self, query: str) -> bool:
+        return settings.parse_routing_enabled and self._complexity(query) < settings.parse_complexity_threshold
+
+    def _accept_fast_result(self, parsed: Optional[ParsedQuery], started: float) -> bool:
+        self._record_tier("haiku", started)
+
+        if parsed is None:
+            self._record_escalation("schema_failure")
+            return False
+
+        if not parsed.model_dump(exclude={"limit"}, exclude_none=True):
+            self._record_escalation("low_confidence")
+            return False
+
+        return True
+
+    def _record_escalation(self, reason: str) -> None:
+        metrics.increment("query_router.escalations")
+        metrics.increment(f"query_router.escalations.{reason}")
+
+    def _record_tier(self, tier: str, started: float) -> None:
+        metrics.increment(f"query_router.{tier}.calls")
+        metrics.observe(f"query_router.{tier}.latency", time.monotonic() - started)
+
+    async def aparse_to_dict(self, query: str, mode: SearchMode = SearchMode.STRICT) -> Dict[str, Any]:
+        return await parse_flight.do(
+            fingerprint(" ".join(query.split()), mode.value),
+            lambda: self._guarded_parse_to_dict(query, mode),
+            clone=copy.deepcopy
+        )
+
+    async def _guarded_parse_to_dict(self, query: str, mode: SearchMode) -> Dict[str, Any]:
+        try:
+            return await parse_breaker.call(lambda: self._aparse_to_dict(query, mode))
+        except CircuitOpenError:
+            return self._finalize_single_condition(self._rule_based_parse(query), query, mode)
+
+    async def _aparse_to_dict(self, query: str, mode: SearchMode) -> Dict[str, Any]:
+        return self._finalize(await self.aparse(query), query, mode)
+
+    def _rule_based_parse(self, query: str) -> QueryFilter:
+        genders = [gender for keyword, gender in self.GENDER_MAPPING.items() if len(keyword) > 1 and keyword in query]
+        age_groups = list(dict.fromkeys(f"{decade}0대" for decade in re.findall(r"([1-9])0대", query)))
+        regions = [region for region in self.REGION_KEYWORDS if region in query]
+        limit_match = re.search(r"(\d+)\s*명", query)
+
+        return QueryFilter(
+            gender=genders[0] if len(genders) == 1 else None,
+            age_group=(age_groups[0] if len(age_groups) == 1 else age_groups) or None,
+            region=regions or None,
+            limit=min(max(int(limit_match.group(1)), 1), 1000) if limit_match else 100
         )
 
-    def parse(self, query: str) -> QueryFilter:
-        chain = self.prompt | self.llm | self.parser
-        return chain.invoke({"query": query})
+    def _finalize(self, parsed: ParsedQuery, query: str, mode: SearchMode) -> Dict[str, Any]:
+        if parsed.conditions:
+            result = {"conditions": [condition.model_dump(exclude_none=True) for condition in parsed.conditions]}
+            return self._finalize_multi_condition(result, query, mode)
+        return self._finalize_single_condition(parsed, query, mode)
 
-    def parse_to_dict(self, query: str, mode: SearchMode = SearchMode.STRICT) -> Dict[str, Any]:
-        multi_condition_keywords = [',', '과 ', '와 ', '그리고', '각각', '및 ']
-        has_multi_condition = any(kw in query for kw in multi_condition_keywords)
+    def _finalize_multi_condition(self, result: Dict[str, Any], query: str, mode: SearchMode) -> Dict[str, Any]:
+        for condition in result['conditions']:
+            condition = self._expand_frequency_filters(condition, query)
+            condition.update(self._apply_mode_params(condition, mode))
+        return result
 
-        if has_multi_condition:
-            try:
-                result = self._parse_raw(query)
-                if 'conditions' in result:
-                    for condition in result['conditions']:
-                        condition = self._expand_frequency_filters(condition, query)
-                        condition.update(self._apply_mode_params(condition, mode))
-                    return result
-            except Exception:
-                pass
-
-        filter_obj = self.parse(query)
-        parsed_filter = filter_obj.model_dump()
+    def _finalize_single_condition(self, filter_obj: QueryFilter, query: str, mode: SearchMode) -> Dict[str, Any]:
+        parsed_filter = filter_obj.model_dump(exclude={"conditions"})
         parsed_filter = self._expand_frequency_filters(parsed_filter, query)
         return self._apply_mode_params(parsed_filter, mode)
 
-    def _parse_raw(self, query: str) -> Dict[str, Any]:
-        result = (self.prompt | self.llm).invoke({"query": query})
-        content = result.content.strip()
-
-        if content.startswith("```"):
-            lines = content.split("\n")
-            json_lines = []
-            in_json = False
-            for line in lines:
-                if line.startswith("```") and not in_json:
-                    in_json = True
-                    continue
-                elif line.startswith("```") and in_json:
-                    break
-                elif in_json:
-                    json_lines.append(line)
-            content = "\n".join(json_lines)
-
-        return json.loads(content)
-
     def _detect_frequency_level(self, query: str) -> str:
         query_lower = query.lower()
         for level, keywords in FREQUENCY_KEYWORDS.items():
@@ -1,9 +1,16 @@
 from .panel_repository import PanelRepository
 from .search_history_repository import SearchHistoryRepository
 from .library_repository import LibraryRepository
+from .search_history_writer import SearchHistoryWriter, search_history_writer
+from .member_profile_repository import MemberProfileRepository
+from .recommendation_feed_repository import RecommendationFeedRepository
 
 __all__ = [
     "PanelRepository",
     "SearchHistoryRepository",
     "LibraryRepository",
+    "SearchHistoryWriter",
+    "search_history_writer",
+    "MemberProfileRepository",
+    "RecommendationFeedRepository",
 ]
@@ -1,5 +1,5 @@
 from typing import List, Optional
-import json
+import orjson
 
 from src.core.database import Database
 from src.domain.models import Cohort
@@ -18,7 +18,7 @@ class LibraryRepository:
 
         panel_ids = row['panel_ids']
         if isinstance(panel_ids, str):
-            panel_ids = json.loads(panel_ids)
+            panel_ids = orjson.loads(panel_ids)
 
         return Cohort(
             cohort_id=str(row['library_id']),
@@ -38,7 +38,7 @@ class LibraryRepository:
 
         panel_ids = row['panel_ids']
         if isinstance(panel_ids, str):
-            panel_ids = json.loads(panel_ids)
+            panel_ids = orjson.loads(panel_ids)
 
         if not isinstance(panel_ids, list):
             panel_ids = list(panel_ids) if panel_ids else []
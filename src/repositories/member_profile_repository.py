@@ -0,0 +1,42 @@
+from typing import List, Optional
+
+from src.core.database import Database
+from src.domain.models import MemberInterestProfile
+
+
+class MemberProfileRepository:
+    UPSERT_SQL = """
+        INSERT INTO member_interest_profile (member_id, counters, search_count, updated_at)
+        VALUES ($1, $2, $3, $4)
+        ON CONFLICT (member_id) DO UPDATE
+        SET counters = EXCLUDED.counters,
+            search_count = EXCLUDED.search_count,
+            updated_at = EXCLUDED.updated_at
+    """
+
+    async def get(self, member_id: int) -> Optional[MemberInterestProfile]:
+        row = await Database.fetchrow("""
+            SELECT member_id, counters, search_count, updated_at
+            FROM member_interest_profile
+            WHERE member_id = $1
+        """, member_id)
+
+        if not row:
+            return None
+
+        return MemberInterestProfile(
+            member_id=row['member_id'],
+            counters=row['counters'] or {},
+            search_count=row['search_count'] or 0,
+            updated_at=row['updated_at'] or 0.0
+        )
+
+    async def upsert_many(self, profiles: List[MemberInterestProfile]) -> None:
+        if not profiles:
+            return
+
+        async with Database.connection() as conn:
+            await conn.executemany(self.UPSERT_SQL, [
+                (p.member_id, p.counters, p.search_count, p.updated_at)
+                for p in profiles
+            ])
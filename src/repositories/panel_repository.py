@@ -1,11 +1,16 @@
-from typing import List, Dict, Any, Optional
-import json
+from typing import List, Dict, Any, Optional, Tuple
+import time
+import orjson
 
+from src.core.config import settings
 from src.core.database import Database
 from src.domain.models import Panel
 
 
 class PanelRepository:
+    _version: Optional[int] = None
+    _version_checked_at: float = 0.0
+
     SEMANTIC_FIELDS = [
         'lifestyle_tags', 'search_keywords',
         'survey_health', 'survey_consumption',
@@ -37,6 +42,19 @@ class PanelRepository:
         'drinking_experience': '최근 1년 이내 술을 마시지 않음'
     }
 
+    FACET_FIELDS = [
+        'occupation', 'gender', 'age_group',
+        'phone_brand', 'car_brand', 'marital_status'
+    ]
+
+    PANEL_COLUMNS_SQL = """
+        id as panel_id, age, gender, residence, occupation,
+        marital_status, phone_brand, car_brand, profile_summary,
+        hash_tags as hashtags, electronic_devices, smoking_experience,
+        cigarette_brands, e_cigarette, drinking_experience,
+        survey_health, survey_consumption, survey_lifestyle,
+        survey_digital, survey_environment"""
+
     async def search(
         self,
         filters: Dict[str, Any],
@@ -49,12 +67,7 @@ class PanelRepository:
         if query_embedding is not None:
             query_sql = f"""
                 SELECT
-                    id as panel_id, age, gender, residence, occupation,
-                    marital_status, phone_brand, car_brand, profile_summary,
-                    hash_tags as hashtags, electronic_devices, smoking_experience,
-                    cigarette_brands, e_cigarette, drinking_experience,
-                    survey_health, survey_consumption, survey_lifestyle,
-                    survey_digital, survey_environment,
+                    {self.PANEL_COLUMNS_SQL},
                     CASE WHEN embedding IS NOT NULL
                         THEN 1 - (embedding <=> $1::vector)
                         ELSE NULL
@@ -71,12 +84,7 @@ class PanelRepository:
         else:
             query_sql = f"""
                 SELECT
-                    id as panel_id, age, gender, residence, occupation,
-                    marital_status, phone_brand, car_brand, profile_summary,
-                    hash_tags as hashtags, electronic_devices, smoking_experience,
-                    cigarette_brands, e_cigarette, drinking_experience,
-                    survey_health, survey_consumption, survey_lifestyle,
-                    survey_digital, survey_environment,
+                    {self.PANEL_COLUMNS_SQL},
                     NULL as similarity
                 FROM panel
                 WHERE {where_sql}
@@ -87,6 +95,81 @@ class PanelRepository:
         rows = await Database.fetch(query_sql, *params)
         return [self._row_to_panel(row) for row in rows]
 
+    async def search_with_facets(
+        self,
+        filters: Dict[str, Any],
+        query_embedding: Optional[List[float]] = None,
+        limit: int = 100,
+        facets: Optional[List[str]] = None
+    ) -> Tuple[List[Panel], Dict[str, Dict[str, int]]]:
+        facet_fields = [f for f in (facets or self.FACET_FIELDS) if f in self.FACET_FIELDS]
+        if not facet_fields:
+            return await self.search(filters, query_embedding, limit), {}
+
+        where_clauses, params, param_index = self._build_where_clauses(filters, query_embedding)
+        where_sql = " AND ".join(where_clauses) if where_clauses else "1=1"
+
+        if query_embedding is not None:
+            similarity_sql = """
+                    CASE WHEN embedding IS NOT NULL
+                        THEN 1 - (embedding <=> $1::vector)
+                        ELSE NULL
+                    END AS similarity"""
+            order_sql = """
+                ORDER BY
+                    CASE WHEN embedding IS NOT NULL
+                        THEN embedding <=> $1::vector
+                        ELSE 999
+                    END"""
+            outer_order_sql = "ORDER BY similarity DESC NULLS LAST"
+        else:
+            similarity_sql = "NULL::float AS similarity"
+            order_sql = ""
+            outer_order_sql = ""
+
+        query_sql = f"""
+            WITH matched AS (
+                SELECT
+                    {self.PANEL_COLUMNS_SQL}, age_group,
+                    {similarity_sql}
+                FROM panel
+                WHERE {where_sql}
+                {order_sql}
+                LIMIT ${param_index}
+            ),
+            {self._facet_ctes_sql(facet_fields)}
+            SELECT matched.*, (SELECT facets FROM facet_json) AS facets
+            FROM matched
+            {outer_order_sql}
+        """
+
+        params.append(limit)
+        rows = await Database.fetch(query_sql, *params)
+
+        facet_counts = self._parse_jsonb(rows[0]['facets']) if rows else None
+        return [self._row_to_panel(row) for row in rows], facet_counts or {}
+
+    async def facet_counts(
+        self,
+        panel_ids: List[str],
+        facets: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, int]]:
+        facet_fields = [f for f in (facets or self.FACET_FIELDS) if f in self.FACET_FIELDS]
+        if not panel_ids or not facet_fields:
+            return {}
+
+        row = await Database.fetchrow(f"""
+            WITH matched AS (
+                SELECT {", ".join(facet_fields)}
+                FROM panel
+                WHERE id = ANY($1::text[])
+            ),
+            {self._facet_ctes_sql(facet_fields)}
+            SELECT facets FROM facet_json
+        """, panel_ids)
+
+        return (self._parse_jsonb(row['facets']) if row else None) or {}
+
     async def search_by_ids(
         self,
         panel_ids: List[str],
@@ -140,10 +223,7 @@ class PanelRepository:
         if query_embedding is not None:
             query_sql = f"""
                 SELECT
-                    id as panel_id, age, gender, residence, occupation,
-                    marital_status, phone_brand, car_brand, profile_summary,
-                    hash_tags as hashtags, electronic_devices, smoking_experience,
-                    cigarette_brands, e_cigarette, drinking_experience,
+                    {self.PANEL_COLUMNS_SQL},
                     CASE WHEN embedding IS NOT NULL
                         THEN 1 - (embedding <=> $1::vector)
                         ELSE NULL
@@ -159,10 +239,7 @@ class PanelRepository:
         else:
             query_sql = f"""
                 SELECT
-                    id as panel_id, age, gender, residence, occupation,
-                    marital_status, phone_brand, car_brand, profile_summary,
-                    hash_tags as hashtags, electronic_devices, smoking_experience,
-                    cigarette_brands, e_cigarette, drinking_experience,
+                    {self.PANEL_COLUMNS_SQL},
                     NULL as similarity
                 FROM panel
                 WHERE {where_sql}
@@ -181,6 +258,54 @@ class PanelRepository:
         )
         return [self._row_to_panel(row) for row in rows]
 
+    async def get_by_ids_ordered(
+        self,
+        panel_ids: List[str],
+        similarities: List[Optional[float]]
+    ) -> List[Panel]:
+        if not panel_ids:
+            return []
+
+        rows = await Database.fetch(f"""
+            SELECT {self.PANEL_COLUMNS_SQL}
+            FROM panel
+            WHERE id = ANY($1::text[])
+        """, panel_ids)
+
+        rows_by_id = {row['panel_id']: row for row in rows}
+        panels = []
+        for panel_id, similarity in zip(panel_ids, similarities):
+            row = rows_by_id.get(panel_id)
+            if row is None:
+                continue
+            panel = self._row_to_panel(row)
+            panel.similarity = similarity
+            panels.append(panel)
+        return panels
+
+    async def get_version(self) -> Optional[int]:
+        now = time.monotonic()
+        if now - PanelRepository._version_checked_at < settings.panel_version_check_interval:
+            return PanelRepository._version
+
+        try:
+            row = await Database.fetchrow("SELECT version FROM panel_version WHERE id = 1")
+            PanelRepository._version = row['version'] if row else None
+        except Exception:
+            PanelRepository._version = None
+        PanelRepository._version_checked_at = now
+        return PanelRepository._version
+
+    async def bump_version(self) -> int:
+        row = await Database.fetchrow("""
+            INSERT INTO panel_version (id, version) VALUES (1, 1)
+            ON CONFLICT (id) DO UPDATE SET version = panel_version.version + 1
+            RETURNING version
+        """)
+        PanelRepository._version = row['version']
+        PanelRepository._version_checked_at = time.monotonic()
+        return PanelRepository._version
+
     async def aggregate_metric(self, panel_ids: List[str], metric: str) -> Dict[str, int]:
         if not panel_ids:
             return {}
@@ -297,6 +422,31 @@ class PanelRepository:
                 result.append([tags])
         return result
 
+    def _facet_ctes_sql(self, facet_fields: List[str]) -> str:
+        facet_name_sql = " ".join(
+            f"WHEN GROUPING({field}) = 0 THEN '{field}'" for field in facet_fields
+        )
+        facet_value_sql = ", ".join(f"{field}::text" for field in facet_fields)
+        grouping_sets_sql = ", ".join(f"({field})" for field in facet_fields)
+
+        return f"""facet_counts AS (
+                SELECT
+                    CASE {facet_name_sql} END AS facet,
+                    COALESCE({facet_value_sql}) AS value,
+                    COUNT(*) AS count
+                FROM matched
+                GROUP BY GROUPING SETS ({grouping_sets_sql})
+            ),
+            facet_json AS (
+                SELECT jsonb_object_agg(facet, counts) AS facets
+                FROM (
+                    SELECT facet, jsonb_object_agg(value, count) AS counts
+                    FROM facet_counts
+                    WHERE value IS NOT NULL AND value != ''
+                    GROUP BY facet
+                ) per_facet
+            )"""
+
     def _build_where_clauses(
         self,
         filters: Dict[str, Any],
@@ -412,7 +562,7 @@ class PanelRepository:
         return where_clauses, params, param_index
 
     def _row_to_panel(self, row: dict) -> Panel:
-        return Panel(
+        return Panel.model_construct(
             panel_id=row['panel_id'],
             age=row.get('age'),
             gender=row.get('gender'),
@@ -443,8 +593,8 @@ class PanelRepository:
             return value
         if isinstance(value, str):
             try:
-                return json.loads(value)
-            except json.JSONDecodeError:
+                return orjson.loads(value)
+            except orjson.JSONDecodeError:
                 return None
         return None
 
@@ -0,0 +1,39 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.core.database import Database
+
+
+class RecommendationFeedRepository:
+    async def get(self, member_id: int, industry: str) -> Optional[Dict[str, Any]]:
+        row = await Database.fetchrow("""
+            SELECT feed FROM member_recommendation_feed
+            WHERE member_id = $1 AND industry = $2
+        """, member_id, industry)
+
+        return row['feed'] if row else None
+
+    async def upsert(self, member_id: int, industry: str, feed: Dict[str, Any]) -> None:
+        await Database.execute("""
+            INSERT INTO member_recommendation_feed (member_id, industry, feed, generated_at)
+            VALUES ($1, $2, $3, now())
+            ON CONFLICT (member_id, industry) DO UPDATE
+            SET feed = EXCLUDED.feed, generated_at = EXCLUDED.generated_at
+        """, member_id, industry, feed)
+
+    async def get_industries(self, member_id: int) -> List[str]:
+        rows = await Database.fetch("""
+            SELECT industry FROM member_recommendation_feed
+            WHERE member_id = $1
+        """, member_id)
+
+        return [row['industry'] for row in rows]
+
+    async def list_expired(self, max_age_seconds: float, limit: int) -> List[Tuple[int, str]]:
+        rows = await Database.fetch("""
+            SELECT member_id, industry FROM member_recommendation_feed
+            WHERE generated_at < now() - make_interval(secs => $1)
+            ORDER BY generated_at
+            LIMIT $2
+        """, max_age_seconds, limit)
+
+        return [(row['member_id'], row['industry']) for row in rows]
@@ -1,12 +1,29 @@
-from typing import List, Optional
+from typing import List, Optional, Any
 from datetime import datetime
-import json
+import orjson
 
+from src.core.config import settings
 from src.core.database import Database
 from src.domain.models import SearchHistory
 
 
 class SearchHistoryRepository:
+    LEGACY_INSERT_SQL = """
+        INSERT INTO search_history (id, member_id, content, panel_ids, concordance_rate, date)
+        VALUES ($1, $2, $3, $4, $5::double precision[], $6)
+    """
+
+    COMPACT_INSERT_SQL = """
+        INSERT INTO search_history (id, member_id, content, panel_seqs, concordance_rates, date)
+        SELECT
+            $1, $2, $3,
+            COALESCE(array_agg(p.seq ORDER BY t.ord), '{}'),
+            COALESCE(array_agg(t.rate ORDER BY t.ord), '{}'),
+            $6
+        FROM unnest($4::text[], $5::real[]) WITH ORDINALITY AS t(panel_id, rate, ord)
+        JOIN panel p ON p.id = t.panel_id
+    """
+
     async def create(
         self,
         member_id: Optional[int],
@@ -14,17 +31,35 @@ class SearchHistoryRepository:
         panel_ids: List[str],
         concordance_rates: List[float]
     ) -> int:
-        result = await Database.fetchrow("""
-            INSERT INTO search_history (member_id, content, panel_ids, concordance_rate, date)
-            VALUES ($1, $2, $3, $4::double precision[], $5)
-            RETURNING id
-        """, member_id, content, panel_ids, concordance_rates, datetime.now().date())
+        search_id = (await self.allocate_ids(1))[0]
+        await Database.execute(
+            self._insert_sql(),
+            search_id, member_id, content, panel_ids, concordance_rates, datetime.now().date()
+        )
+        return search_id
+
+    async def allocate_ids(self, count: int) -> List[int]:
+        rows = await Database.fetch("""
+            SELECT nextval(pg_get_serial_sequence('search_history', 'id')) AS id
+            FROM generate_series(1, $1)
+        """, count)
+
+        return [row['id'] for row in rows]
 
-        return result['id'] if result else 0
+    async def create_many(self, histories: List[SearchHistory]) -> None:
+        if not histories:
+            return
+
+        async with Database.connection() as conn:
+            await conn.executemany(self._insert_sql(), [
+                (h.id, h.member_id, h.content, h.panel_ids, h.concordance_rate, h.date)
+                for h in histories
+            ])
 
     async def get_by_id(self, search_id: int) -> Optional[SearchHistory]:
-        row = await Database.fetchrow("""
-            SELECT id, member_id, content, panel_ids, concordance_rate, created_date
+        row = await Database.fetchrow(f"""
+            SELECT id, member_id, content, created_date,
+                   {self._panel_ids_sql()}, {self._rates_sql()}
             FROM search_history
             WHERE id = $1
         """, search_id)
@@ -32,44 +67,48 @@ class SearchHistoryRepository:
         if not row:
             return None
 
-        panel_ids = row['panel_ids'] or []
-        if isinstance(panel_ids, str):
-            panel_ids = json.loads(panel_ids)
-
+        panel_ids = self._decode_panel_ids(row)
         return SearchHistory(
             id=row['id'],
             member_id=row.get('member_id'),
             content=row['content'] or '',
             panel_ids=panel_ids,
-            concordance_rate=row.get('concordance_rate') or [],
+            concordance_rate=row.get('rates') or [],
+            panel_count=len(panel_ids),
             date=row.get('created_date')
         )
 
+    async def get_panel_ids(self, search_id: int) -> List[str]:
+        row = await Database.fetchrow(f"""
+            SELECT {self._panel_ids_sql()}
+            FROM search_history
+            WHERE id = $1
+        """, search_id)
+
+        if not row:
+            return []
+
+        return self._decode_panel_ids(row)
+
     async def get_by_member(self, member_id: int, limit: int = 20) -> List[SearchHistory]:
-        rows = await Database.fetch("""
-            SELECT id, member_id, content, panel_ids, concordance_rate, created_date
+        rows = await Database.fetch(f"""
+            SELECT id, member_id, content, created_date, {self._panel_count_sql()} AS panel_count
             FROM search_history
             WHERE member_id = $1
             ORDER BY created_date DESC
             LIMIT $2
         """, member_id, limit)
 
-        histories = []
-        for row in rows:
-            panel_ids = row['panel_ids'] or []
-            if isinstance(panel_ids, str):
-                panel_ids = json.loads(panel_ids)
-
-            histories.append(SearchHistory(
+        return [
+            SearchHistory(
                 id=row['id'],
                 member_id=row.get('member_id'),
                 content=row['content'] or '',
-                panel_ids=panel_ids,
-                concordance_rate=row.get('concordance_rate') or [],
+                panel_count=row['panel_count'] or 0,
                 date=row.get('created_date')
-            ))
-
-        return histories
+            )
+            for row in rows
+        ]
 
     async def get_recent_queries(self, member_id: int, limit: int = 10) -> List[str]:
         rows = await Database.fetch("""
@@ -80,3 +119,44 @@ class SearchHistoryRepository:
         """, member_id, limit)
 
         return [row['content'] for row in rows]
+
+    def _insert_sql(self) -> str:
+        if settings.history_compact_storage:
+            return self.COMPACT_INSERT_SQL
+        return self.LEGACY_INSERT_SQL
+
+    def _panel_ids_sql(self) -> str:
+        if not settings.history_compact_storage:
+            return "panel_ids, NULL::text[] AS compact_panel_ids"
+
+        return """panel_ids,
+                   CASE WHEN panel_seqs IS NOT NULL THEN ARRAY(
+                       SELECT p.id
+                       FROM unnest(panel_seqs) WITH ORDINALITY AS t(seq, ord)
+                       JOIN panel p ON p.seq = t.seq
+                       ORDER BY t.ord
+                   ) END AS compact_panel_ids"""
+
+    def _rates_sql(self) -> str:
+        if not settings.history_compact_storage:
+            return "concordance_rate AS rates"
+        return """CASE WHEN panel_seqs IS NOT NULL THEN ARRAY(
+                       SELECT concordance_rates[t.ord]::double precision
+                       FROM unnest(panel_seqs) WITH ORDINALITY AS t(seq, ord)
+                       JOIN panel p ON p.seq = t.seq
+                       ORDER BY t.ord
+                   ) ELSE concordance_rate END AS rates"""
+
+    def _panel_count_sql(self) -> str:
+        if not settings.history_compact_storage:
+            return "cardinality(concordance_rate)"
+        return "COALESCE(cardinality(panel_seqs), cardinality(concordance_rate))"
+
+    def _decode_panel_ids(self, row: Any) -> List[str]:
+        if row['compact_panel_ids'] is not None:
+            return list(row['compact_panel_ids'])
+
+        panel_ids = row['panel_ids'] or []
+        if isinstance(panel_ids, str):
+            panel_ids = orjson.loads(panel_ids)
+        return panel_ids
@@ -0,0 +1,126 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from src.core.config import settings
+from src.core.exceptions import DatabaseError
+from src.domain.models import SearchHistory
+from .search_history_repository import SearchHistoryRepository
+
+
+logger = logging.getLogger(__name__)
+
+class SearchHistoryWriter:
+    def __init__(self, repository: Optional[SearchHistoryRepository] = None):
+        self.repository = repository or SearchHistoryRepository()
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=settings.history_queue_size)
+        self._task: Optional[asyncio.Task] = None
+        self._id_pool: List[int] = []
+        self._id_lock = asyncio.Lock()
+        self._pending: Dict[int, SearchHistory] = {}
+        self.written = 0
+        self.dropped = 0
+
+    async def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def submit(
+        self,
+        member_id: Optional[int],
+        content: str,
+        panel_ids: List[str],
+        concordance_rates: List[float]
+    ) -> int:
+        search_id = await self._next_id()
+        history = SearchHistory(
+            id=search_id,
+            member_id=member_id,
+            content=content,
+            panel_ids=panel_ids,
+            concordance_rate=concordance_rates,
+            panel_count=len(panel_ids),
+            date=datetime.now().date()
+        )
+
+        self._pending[search_id] = history
+        await self.start()
+        await self._queue.put(history)
+        return search_id
+
+    def get_pending(self, search_id: int) -> Optional[SearchHistory]:
+        return self._pending.get(search_id)
+
+    async def close(self) -> None:
+        if self._task is None:
+            return
+
+        try:
+            await asyncio.wait_for(self._queue.join(), settings.history_drain_timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        if self._pending:
+            self._drop(list(self._pending.values()), "drain timeout")
+
+    async def _next_id(self) -> int:
+        async with self._id_lock:
+            if not self._id_pool:
+                try:
+                    self._id_pool = await self.repository.allocate_ids(settings.history_id_block_size)
+                except Exception as e:
+                    raise DatabaseError("search_history id allocation", str(e))
+            return self._id_pool.pop(0)
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + settings.history_flush_interval
+
+            while len(batch) < settings.history_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._write(batch)
+            for _ in batch:
+                self._queue.task_done()
+
+    async def _write(self, batch: List[SearchHistory]) -> None:
+        for attempt in range(settings.history_write_retries):
+            try:
+                await self.repository.create_many(batch)
+                self.written += len(batch)
+                break
+            except Exception:
+                await asyncio.sleep(0.1 * (2 ** attempt))
+        else:
+            self._drop(batch, "write failed")
+            return
+
+        for history in batch:
+            self._pending.pop(history.id, None)
+
+    def _drop(self, histories: List[SearchHistory], reason: str) -> None:
+        self.dropped += len(histories)
+        for history in histories:
+            self._pending.pop(history.id, None)
+        logger.error(
+            "Dropped %d search history rows (%s): search_ids=%s",
+            len(histories), reason, [history.id for history in histories]
+        )
+
+
+search_history_writer = SearchHistoryWriter()
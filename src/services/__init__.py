@@ -1,9 +1,17 @@
 from .search_service import SearchService
 from .recommendation_service import RecommendationService
 from .comparison_service import ComparisonService
+from .member_profiles import MemberProfileStore, member_profiles
+from .feed_refresher import RecommendationFeedRefresher, feed_refresher
+from .warmup import warm_up
 
 __all__ = [
     "SearchService",
     "RecommendationService",
     "ComparisonService",
+    "MemberProfileStore",
+    "member_profiles",
+    "RecommendationFeedRefresher",
+    "feed_refresher",
+    "warm_up",
 ]
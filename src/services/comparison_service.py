@@ -1,9 +1,12 @@
-from typing import List, Dict, Any, Optional
+import asyncio
+from typing import AsyncIterator, Awaitable, List, Dict, Any, Optional, Tuple
 from collections import Counter
 from scipy import stats
 import numpy as np
 
-from src.core.exceptions import NotFoundError
+from src.core import deadline
+from src.core.config import settings
+from src.core.exceptions import DeadlineExceededError, NotFoundError, PanelSearchException
 from src.repositories import PanelRepository, LibraryRepository
 from src.llm import InsightGenerator
 from src.api.schemas.comparison import (
@@ -49,26 +52,7 @@ class ComparisonService:
         cohort_2_id: int,
         metrics: Optional[List[str]] = None
     ) -> Dict[str, Any]:
-        cohort_1 = await self.library_repo.get_by_id(cohort_1_id)
-        cohort_2 = await self.library_repo.get_by_id(cohort_2_id)
-
-        if not cohort_1:
-            raise NotFoundError("Cohort", str(cohort_1_id))
-        if not cohort_2:
-            raise NotFoundError("Cohort", str(cohort_2_id))
-
-        cohort_1_info = CohortBasicInfo(
-            cohort_id=cohort_1.cohort_id,
-            cohort_name=cohort_1.cohort_name,
-            panel_count=cohort_1.panel_count,
-            created_at=cohort_1.created_at
-        )
-        cohort_2_info = CohortBasicInfo(
-            cohort_id=cohort_2.cohort_id,
-            cohort_name=cohort_2.cohort_name,
-            panel_count=cohort_2.panel_count,
-            created_at=cohort_2.created_at
-        )
+        cohort_1, cohort_2, cohort_1_info, cohort_2_info = await self._load_cohorts(cohort_1_id, cohort_2_id)
 
         panel_ids_1 = cohort_1.panel_ids
         panel_ids_2 = cohort_2.panel_ids
@@ -115,9 +99,118 @@ class ComparisonService:
             "region_distribution": region_distribution,
             "gender_distribution": gender_distribution,
             "key_insights": key_insights,
-            "summary": summary
+            "summary": summary,
+            "skipped_stages": deadline.skipped_stages()
+        }
+
+    async def stream_comparison(
+        self,
+        cohort_1_id: int,
+        cohort_2_id: int,
+        metrics: Optional[List[str]] = None
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        cohort_1, cohort_2, cohort_1_info, cohort_2_info = await self._load_cohorts(cohort_1_id, cohort_2_id)
+        yield "cohorts", {"cohort_1": cohort_1_info, "cohort_2": cohort_2_info}
+
+        panel_ids_1 = cohort_1.panel_ids
+        panel_ids_2 = cohort_2.panel_ids
+        count_1 = cohort_1.panel_count
+        count_2 = cohort_2.panel_count
+
+        if not metrics:
+            metrics = [m[0] for m in COMPARISON_METRICS[:5]]
+
+        sections: Dict[str, Awaitable] = {
+            "comparisons": self._compare_metrics(panel_ids_1, panel_ids_2, metrics, count_1, count_2),
+            "basic_info": self._compare_basic_info(panel_ids_1, panel_ids_2),
+            "characteristics": self._find_characteristics(panel_ids_1, panel_ids_2, count_1, count_2),
+            "region_distribution": self._calculate_region_distribution(panel_ids_1, panel_ids_2, count_1, count_2),
+            "gender_distribution": self._calculate_gender_distribution(panel_ids_1, panel_ids_2, count_1, count_2),
+        }
+        tasks = {asyncio.ensure_future(coro): name for name, coro in sections.items()}
+        results: Dict[str, Any] = {}
+        failed: List[str] = []
+
+        try:
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name = tasks[task]
+                    try:
+                        results[name] = task.result()
+                    except Exception as e:
+                        failed.append(name)
+                        yield "error", self._stream_error(name, e)
+                        continue
+                    yield name, results[name]
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        if "comparisons" in results:
+            yield "summary", self._generate_summary(cohort_1_info, cohort_2_info, results["comparisons"])
+
+        key_insights = None
+        insight_sections = ("comparisons", "basic_info", "characteristics")
+        if any(name in failed for name in insight_sections):
+            deadline.skip("insights")
+            failed.append("insights")
+        elif deadline.allows("insights", settings.insights_min_budget):
+            try:
+                inputs = await self._insight_inputs(
+                    cohort_1_info, cohort_2_info,
+                    panel_ids_1, panel_ids_2,
+                    results["comparisons"], results["basic_info"], results["characteristics"]
+                )
+                async for event, data in self.insight_generator.stream_cohort_insights(*inputs):
+                    if event == "key_insights":
+                        key_insights = data
+                    else:
+                        yield event, data
+            except DeadlineExceededError:
+                deadline.skip("insights")
+            except Exception as e:
+                key_insights = None
+                deadline.skip("insights")
+                failed.append("insights")
+                yield "error", self._stream_error("insights", e)
+
+        yield "done", {
+            "key_insights": key_insights,
+            "skipped_stages": deadline.skipped_stages(),
+            "failed_stages": failed
         }
 
+    def _stream_error(self, stage: str, error: Exception) -> Dict[str, Any]:
+        if isinstance(error, PanelSearchException):
+            return {"stage": stage, "error": error.code, "message": error.message}
+        return {"stage": stage, "error": "INTERNAL_SERVER_ERROR", "message": str(error)}
+
+    async def _load_cohorts(self, cohort_1_id: int, cohort_2_id: int) -> Tuple[Any, Any, CohortBasicInfo, CohortBasicInfo]:
+        cohort_1 = await self.library_repo.get_by_id(cohort_1_id)
+        cohort_2 = await self.library_repo.get_by_id(cohort_2_id)
+
+        if not cohort_1:
+            raise NotFoundError("Cohort", str(cohort_1_id))
+        if not cohort_2:
+            raise NotFoundError("Cohort", str(cohort_2_id))
+
+        cohort_1_info = CohortBasicInfo(
+            cohort_id=cohort_1.cohort_id,
+            cohort_name=cohort_1.cohort_name,
+            panel_count=cohort_1.panel_count,
+            created_at=cohort_1.created_at
+        )
+        cohort_2_info = CohortBasicInfo(
+            cohort_id=cohort_2.cohort_id,
+            cohort_name=cohort_2.cohort_name,
+            panel_count=cohort_2.panel_count,
+            created_at=cohort_2.created_at
+        )
+
+        return cohort_1, cohort_2, cohort_1_info, cohort_2_info
+
     async def _compare_metrics(
         self,
         panel_ids_1: List[str],
@@ -485,63 +578,82 @@ class ComparisonService:
         basic_info: List[BasicInfoComparison],
         characteristics: List[CharacteristicComparison]
     ) -> Optional[KeyInsights]:
+        if not deadline.allows("insights", settings.insights_min_budget):
+            return None
+
         try:
-            hashtags_1 = await self.panel_repo.get_hashtags_sample(panel_ids_1, 50)
-            hashtags_2 = await self.panel_repo.get_hashtags_sample(panel_ids_2, 50)
+            inputs = await self._insight_inputs(
+                cohort_1, cohort_2, panel_ids_1, panel_ids_2,
+                comparisons, basic_info, characteristics
+            )
+            return await self.insight_generator.generate_cohort_insights(*inputs)
 
-            flat_tags_1 = [tag for tags in hashtags_1 for tag in tags]
-            flat_tags_2 = [tag for tags in hashtags_2 for tag in tags]
+        except DeadlineExceededError:
+            deadline.skip("insights")
+            return None
+        except Exception:
+            return None
 
-            top_tags_1 = [tag for tag, _ in Counter(flat_tags_1).most_common(5)]
-            top_tags_2 = [tag for tag, _ in Counter(flat_tags_2).most_common(5)]
+    async def _insight_inputs(
+        self,
+        cohort_1: CohortBasicInfo,
+        cohort_2: CohortBasicInfo,
+        panel_ids_1: List[str],
+        panel_ids_2: List[str],
+        comparisons: List[MetricComparison],
+        basic_info: List[BasicInfoComparison],
+        characteristics: List[CharacteristicComparison]
+    ) -> Tuple[dict, dict, List[dict], List[dict], List[dict]]:
+        hashtags_1 = await self.panel_repo.get_hashtags_sample(panel_ids_1, 50)
+        hashtags_2 = await self.panel_repo.get_hashtags_sample(panel_ids_2, 50)
 
-            cohort_1_info = {
-                "name": cohort_1.cohort_name,
-                "panel_count": cohort_1.panel_count,
-                "hash_tags_summary": top_tags_1
-            }
-            cohort_2_info = {
-                "name": cohort_2.cohort_name,
-                "panel_count": cohort_2.panel_count,
-                "hash_tags_summary": top_tags_2
-            }
+        flat_tags_1 = [tag for tags in hashtags_1 for tag in tags]
+        flat_tags_2 = [tag for tags in hashtags_2 for tag in tags]
 
-            comparisons_data = [
-                {
-                    "metric_label": c.metric_label,
-                    "cohort_1_data": c.cohort_1_data,
-                    "cohort_2_data": c.cohort_2_data,
-                    "is_significant": c.statistical_test.get("is_significant", False) if c.statistical_test else False
-                }
-                for c in comparisons
-            ]
+        top_tags_1 = [tag for tag, _ in Counter(flat_tags_1).most_common(5)]
+        top_tags_2 = [tag for tag, _ in Counter(flat_tags_2).most_common(5)]
 
-            basic_info_data = [
-                {
-                    "metric_label": b.metric_label,
-                    "cohort_1_value": b.cohort_1_value,
-                    "cohort_2_value": b.cohort_2_value,
-                    "difference": b.difference
-                }
-                for b in basic_info if b.cohort_1_value is not None and b.cohort_2_value is not None
-            ]
+        cohort_1_info = {
+            "name": cohort_1.cohort_name,
+            "panel_count": cohort_1.panel_count,
+            "hash_tags_summary": top_tags_1
+        }
+        cohort_2_info = {
+            "name": cohort_2.cohort_name,
+            "panel_count": cohort_2.panel_count,
+            "hash_tags_summary": top_tags_2
+        }
 
-            characteristics_data = [
-                {
-                    "characteristic": ch.characteristic,
-                    "cohort_1_percentage": ch.cohort_1_percentage,
-                    "cohort_2_percentage": ch.cohort_2_percentage
-                }
-                for ch in characteristics
-            ]
+        comparisons_data = [
+            {
+                "metric_label": c.metric_label,
+                "cohort_1_data": c.cohort_1_data,
+                "cohort_2_data": c.cohort_2_data,
+                "is_significant": c.statistical_test.get("is_significant", False) if c.statistical_test else False
+            }
+            for c in comparisons
+        ]
 
-            return await self.insight_generator.generate_cohort_insights(
-                cohort_1_info, cohort_2_info,
-                comparisons_data, basic_info_data, characteristics_data
-            )
+        basic_info_data = [
+            {
+                "metric_label": b.metric_label,
+                "cohort_1_value": b.cohort_1_value,
+                "cohort_2_value": b.cohort_2_value,
+                "difference": b.difference
+            }
+            for b in basic_info if b.cohort_1_value is not None and b.cohort_2_value is not None
+        ]
 
-        except Exception:
-            return None
+        characteristics_data = [
+            {
+                "characteristic": ch.characteristic,
+                "cohort_1_percentage": ch.cohort_1_percentage,
+                "cohort_2_percentage": ch.cohort_2_percentage
+            }
+            for ch in characteristics
+        ]
+
+        return cohort_1_info, cohort_2_info, comparisons_data, basic_info_data, characteristics_data
 
     def _generate_summary(
         self,
@@ -0,0 +1,118 @@
+import asyncio
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from src.core.config import settings
+from src.core.metrics import metrics
+from src.repositories import RecommendationFeedRepository
+
+if TYPE_CHECKING:
+    from .recommendation_service import RecommendationService
+
+
+LLM_STRATEGIES = {"llm", "pattern", "pattern_fallback"}
+BUDGET_WINDOW_SECONDS = 3600
+
+
+class RecommendationFeedRefresher:
+    def __init__(self, repository: Optional[RecommendationFeedRepository] = None):
+        self.repository = repository or RecommendationFeedRepository()
+        self.service: Optional["RecommendationService"] = None
+        self._stale: Dict[Tuple[int, Optional[str]], float] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._llm_budget = settings.feed_llm_budget_per_hour
+        self._budget_reset_at = 0.0
+
+    async def start(self, service: "RecommendationService") -> None:
+        self.service = service
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def mark_stale(self, member_id: int) -> None:
+        self._stale[(member_id, None)] = time.monotonic() + settings.feed_refresh_debounce
+
+    def request(self, member_id: int, industry: str) -> None:
+        self._stale[(member_id, industry)] = 0.0
+
+    async def close(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def refresh_once(self) -> int:
+        jobs = await self._due_jobs()
+        semaphore = asyncio.Semaphore(settings.feed_refresh_concurrency)
+
+        async def run(member_id: int, industry: str) -> bool:
+            async with semaphore:
+                return await self._refresh(member_id, industry)
+
+        results = await asyncio.gather(*[run(member_id, industry) for member_id, industry in jobs])
+        metrics.set_gauge("recommendation_feed.stale", len(self._stale))
+        metrics.set_gauge("recommendation_feed.llm_budget", self._llm_budget)
+        return sum(results)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(settings.feed_refresh_interval)
+            try:
+                await self.refresh_once()
+            except Exception:
+                metrics.increment("recommendation_feed.cycle_failures")
+
+    async def _due_jobs(self) -> List[Tuple[int, str]]:
+        now = time.monotonic()
+        due = [
+            key for key, due_at in self._stale.items() if due_at <= now
+        ][:settings.feed_refresh_batch_size]
+
+        jobs: Dict[Tuple[int, str], None] = {}
+        for member_id, industry in due:
+            del self._stale[(member_id, industry)]
+            if industry is not None:
+                jobs[(member_id, industry)] = None
+                continue
+            for known in await self.repository.get_industries(member_id):
+                jobs[(member_id, known)] = None
+
+        remaining = settings.feed_refresh_batch_size - len(jobs)
+        if remaining > 0:
+            for job in await self.repository.list_expired(settings.feed_max_age, remaining):
+                jobs[job] = None
+
+        return list(jobs)
+
+    async def _refresh(self, member_id: int, industry: str) -> bool:
+        allow_llm = self._has_llm_budget()
+        try:
+            feed = await self.service.compute_member_feed(member_id, industry, settings.feed_size, allow_llm)
+            if feed is None:
+                self._stale.setdefault((member_id, industry), self._budget_reset_at + BUDGET_WINDOW_SECONDS)
+                metrics.increment("recommendation_feed.deferred")
+                return False
+
+            if feed["strategy"] in LLM_STRATEGIES:
+                self._llm_budget -= 1
+            await self.repository.upsert(member_id, industry, feed)
+            metrics.increment("recommendation_feed.refreshed")
+            metrics.increment(f"recommendation_feed.refreshed.{feed['strategy']}")
+            return True
+        except Exception:
+            metrics.increment("recommendation_feed.refresh_failures")
+            return False
+
+    def _has_llm_budget(self) -> bool:
+        now = time.monotonic()
+        if now - self._budget_reset_at >= BUDGET_WINDOW_SECONDS:
+            self._budget_reset_at = now
+            self._llm_budget = settings.feed_llm_budget_per_hour
+        return self._llm_budget > 0
+
+
+feed_refresher = RecommendationFeedRefresher()
@@ -0,0 +1,207 @@
+import asyncio
+import contextvars
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from src.core.cache import recommendation_cache
+from src.core.config import settings
+from src.core.metrics import metrics
+from src.core.singleflight import profile_flight
+from src.domain.models import MemberInterestProfile
+from src.repositories import MemberProfileRepository
+from src.utils.constants import AGE_GROUP_EXPANSIONS, GENDER_MAPPING, RESIDENCE_EXPANSIONS
+
+
+SCALAR_DIMENSIONS = ["age_group", "gender", "region", "occupation", "marital_status"]
+BRAND_FIELDS = ["brands", "phone_brand", "car_brand"]
+SURVEY_FIELDS = ["survey_health", "survey_consumption", "survey_lifestyle", "survey_digital"]
+
+GENDER_TERMS = {canonical: term for term, canonical in GENDER_MAPPING.items() if len(term) > 1}
+AGE_QUALIFIERS = ("초반", "후반")
+
+SECONDS_PER_DAY = 86400
+
+
+class MemberProfileStore:
+    def __init__(self, repository: Optional[MemberProfileRepository] = None):
+        self.repository = repository or MemberProfileRepository()
+        self._profiles: "OrderedDict[int, MemberInterestProfile]" = OrderedDict()
+        self._dirty: Dict[int, MemberInterestProfile] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_failures = 0
+        self._updates: Set[asyncio.Task] = set()
+
+    async def get(self, member_id: int) -> Optional[MemberInterestProfile]:
+        try:
+            profile = await self._load(member_id)
+        except Exception:
+            return None
+
+        self._decay(profile, time.time())
+        return profile
+
+    def submit(self, member_id: int, filters: Dict[str, Any]) -> None:
+        task = self._background(self.record_search(member_id, dict(filters)))
+        self._updates.add(task)
+        task.add_done_callback(self._updates.discard)
+
+    async def record_search(self, member_id: int, filters: Dict[str, Any]) -> None:
+        interests = self.extract_interests(filters)
+        if not interests:
+            return
+
+        try:
+            profile = await self._load(member_id)
+        except Exception:
+            metrics.increment("member_profile.load_failures")
+            return
+
+        self._decay(profile, time.time())
+        for dimension, values in interests.items():
+            counter = profile.counters.setdefault(dimension, {})
+            for value in values:
+                counter[value] = counter.get(value, 0.0) + 1.0
+        profile.search_count += 1
+
+        self._dirty[member_id] = profile
+        self._schedule_flush()
+        recommendation_cache.invalidate(member_id)
+        metrics.increment("member_profile.updates")
+
+    def extract_interests(self, filters: Dict[str, Any]) -> Dict[str, List[str]]:
+        conditions = filters.get("conditions")
+        if not isinstance(conditions, list):
+            conditions = [filters]
+
+        interests: Dict[str, Set[str]] = {}
+        for condition in conditions:
+            for dimension in SCALAR_DIMENSIONS:
+                value = condition.get(dimension)
+                if dimension == "region" and value is None:
+                    value = condition.get("residence")
+                self._add(interests, dimension, self._display_terms(dimension, value))
+            for field in BRAND_FIELDS:
+                self._add(interests, "brands", condition.get(field))
+            for field in SURVEY_FIELDS:
+                survey = condition.get(field)
+                if isinstance(survey, dict):
+                    self._add(interests, field, list(survey.keys()))
+
+        return {dimension: sorted(values) for dimension, values in interests.items()}
+
+    def top_interests(self, profile: MemberInterestProfile) -> Dict[str, List[Tuple[str, float]]]:
+        return {
+            dimension: sorted(counter.items(), key=lambda item: item[1], reverse=True)[:settings.member_profile_top_values]
+            for dimension, counter in profile.counters.items()
+            if counter
+        }
+
+    def strength(self, profile: MemberInterestProfile) -> float:
+        return max((sum(counter.values()) for counter in profile.counters.values()), default=0.0)
+
+    async def flush(self) -> None:
+        if not self._dirty:
+            return
+
+        dirty, self._dirty = self._dirty, {}
+        persisted = False
+        try:
+            await self.repository.upsert_many(list(dirty.values()))
+            persisted = True
+            self._flush_failures = 0
+            metrics.increment("member_profile.persisted", len(dirty))
+        except Exception:
+            self._flush_failures += 1
+            metrics.increment("member_profile.persist_failures")
+        finally:
+            if not persisted:
+                for member_id, profile in dirty.items():
+                    self._dirty.setdefault(member_id, profile)
+
+    async def close(self) -> None:
+        if self._updates:
+            await asyncio.gather(*self._updates, return_exceptions=True)
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+        self._flush_task = None
+        await self.flush()
+
+    async def _load(self, member_id: int) -> MemberInterestProfile:
+        profile = self._profiles.get(member_id)
+        if profile is None:
+            profile = self._dirty.get(member_id)
+        if profile is None:
+            stored = await profile_flight.do(str(member_id), lambda: self.repository.get(member_id))
+            profile = self._profiles.get(member_id) or stored or MemberInterestProfile(member_id=member_id)
+
+        self._profiles[member_id] = profile
+        self._profiles.move_to_end(member_id)
+        while len(self._profiles) > settings.member_profile_max_members:
+            self._profiles.popitem(last=False)
+        return profile
+
+    def _decay(self, profile: MemberInterestProfile, now: float) -> None:
+        if profile.updated_at:
+            elapsed_days = max(0.0, now - profile.updated_at) / SECONDS_PER_DAY
+            factor = 0.5 ** (elapsed_days / settings.member_profile_half_life_days)
+            if factor < 1:
+                for dimension, counter in list(profile.counters.items()):
+                    decayed = {
+                        value: weight * factor
+                        for value, weight in counter.items()
+                        if weight * factor >= settings.member_profile_prune_weight
+                    }
+                    if decayed:
+                        profile.counters[dimension] = decayed
+                    else:
+                        del profile.counters[dimension]
+        profile.updated_at = now
+
+    def _display_terms(self, dimension: str, value: Any) -> List[str]:
+        values = [v.strip() for v in (value if isinstance(value, list) else [value]) if isinstance(v, str) and v.strip()]
+        if dimension == "gender":
+            return [GENDER_TERMS.get(v, v) for v in values]
+        if dimension == "age_group":
+            return self._collapse(values, AGE_GROUP_EXPANSIONS) or [
+                v for v in values if not v.endswith(AGE_QUALIFIERS)
+            ] or values
+        if dimension == "region":
+            return self._collapse(values, RESIDENCE_EXPANSIONS) or values
+        return values
+
+    def _collapse(self, values: List[str], expansions: Dict[str, List[str]]) -> List[str]:
+        for term, expanded in expansions.items():
+            if set(values) == set(expanded):
+                return [term]
+        return []
+
+    def _add(self, interests: Dict[str, Set[str]], dimension: str, value: Any) -> None:
+        values = value if isinstance(value, list) else [value]
+        for item in values:
+            if isinstance(item, str) and item.strip():
+                interests.setdefault(dimension, set()).add(item.strip())
+
+    def _schedule_flush(self) -> None:
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = self._background(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        while True:
+            await asyncio.sleep(min(
+                settings.member_profile_flush_interval * 2 ** self._flush_failures,
+                settings.member_profile_flush_max_delay
+            ))
+            await self.flush()
+            if not self._dirty:
+                return
+
+    def _background(self, coro) -> asyncio.Task:
+        return asyncio.get_running_loop().create_task(coro, context=contextvars.Context())
+
+
+member_profiles = MemberProfileStore()
@@ -1,9 +1,17 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import re
 import random
 
+from src.core import deadline
+from src.core.cache import recommendation_cache
+from src.core.circuit_breaker import recommendation_breaker
+from src.core.config import settings
+from src.core.metrics import metrics
+from src.core.singleflight import fingerprint
 from src.llm import InsightGenerator
-from src.repositories import SearchHistoryRepository
+from src.repositories import RecommendationFeedRepository, SearchHistoryRepository
+from .feed_refresher import feed_refresher
+from .member_profiles import member_profiles
 
 
 INDUSTRY_TO_JOB_MAPPING = {
@@ -33,6 +41,23 @@ INDUSTRY_TO_JOB_MAPPING = {
     "기타/프리랜서": "기타/프리랜서",
 }
 
+CACHEABLE_STRATEGIES = {"profile", "pattern", "llm"}
+
+PROFILE_PATTERN_CATEGORIES = {
+    "age_group": "demographic",
+    "gender": "demographic",
+    "region": "demographic",
+    "marital_status": "demographic",
+    "occupation": "occupation",
+    "brands": "brand",
+    "survey_health": "survey_health",
+    "survey_digital": "survey_digital",
+    "survey_lifestyle": "survey_lifestyle",
+    "survey_consumption": "survey_consumption",
+}
+
+PROFILE_QUERY_DIMENSIONS = ["age_group", "gender", "region", "marital_status", "occupation", "brands"]
+
 INDUSTRY_RECOMMENDATIONS = {
     "마케팅/광고/홍보": [
         {"query": "20대 30대 여성 300명", "category": "연령대"},
@@ -137,20 +162,22 @@ class RecommendationService:
     def __init__(self):
         self.insight_generator = InsightGenerator()
         self.search_history_repo = SearchHistoryRepository()
+        self.feed_repo = RecommendationFeedRepository()
+        self.feed_refresher = feed_refresher
+        self.cache = recommendation_cache
+        self.member_profiles = member_profiles
 
     async def get_recommendations(
         self,
         search_history: Optional[List[str]] = None,
         industry: str = "마케팅/광고/홍보",
-        limit: int = 6
+        limit: int = 6,
+        member_id: Optional[int] = None
     ) -> Dict[str, Any]:
         if not search_history or len(search_history) == 0:
             return self._get_static_recommendations(limit, industry)
 
-        try:
-            patterns = self.insight_generator.extract_patterns(search_history)
-        except Exception:
-            patterns = {}
+        patterns = await self._extract_patterns(search_history, member_id)
 
         if len(search_history) <= 2 or len(patterns) < 2:
             recommendations = self._filter_by_patterns(patterns, limit, industry)
@@ -159,12 +186,16 @@ class RecommendationService:
                 "strategy": "pattern",
                 "total": len(recommendations),
                 "patterns": patterns,
-                "industry": industry
+                "industry": industry,
+                "skipped_stages": deadline.skipped_stages()
             }
 
         try:
-            recommendations = self.insight_generator.generate_recommendations(
-                search_history, patterns
+            if not deadline.allows("personalized_recommendations", settings.recommendation_llm_min_budget):
+                raise Exception("Insufficient latency budget")
+
+            recommendations = await recommendation_breaker.call(
+                lambda: self.insight_generator.generate_recommendations(search_history, patterns)
             )
 
             if not recommendations:
@@ -175,7 +206,8 @@ class RecommendationService:
                 "strategy": "llm",
                 "total": len(recommendations),
                 "patterns": patterns,
-                "industry": industry
+                "industry": industry,
+                "skipped_stages": deadline.skipped_stages()
             }
 
         except Exception:
@@ -185,7 +217,8 @@ class RecommendationService:
                 "strategy": "pattern_fallback",
                 "total": len(recommendations),
                 "patterns": patterns,
-                "industry": industry
+                "industry": industry,
+                "skipped_stages": deadline.skipped_stages()
             }
 
     async def get_recommendations_by_member(
@@ -194,8 +227,131 @@ class RecommendationService:
         industry: str = "마케팅/광고/홍보",
         limit: int = 6
     ) -> Dict[str, Any]:
+        if not settings.feed_refresh_enabled:
+            return await self.compute_member_feed(member_id, industry, limit)
+
+        try:
+            feed = await self.feed_repo.get(member_id, industry)
+        except Exception:
+            feed = None
+
+        if feed is None:
+            metrics.increment("recommendation_feed.cold")
+            self.feed_refresher.request(member_id, industry)
+            return self._get_static_recommendations(limit, industry)
+
+        metrics.increment("recommendation_feed.served")
+        recommendations = feed["recommendations"][:limit]
+        return {**feed, "recommendations": recommendations, "total": len(recommendations)}
+
+    async def compute_member_feed(
+        self,
+        member_id: int,
+        industry: str = "마케팅/광고/홍보",
+        limit: int = 6,
+        allow_llm: bool = True
+    ) -> Optional[Dict[str, Any]]:
         search_history = await self.search_history_repo.get_recent_queries(member_id)
-        return await self.get_recommendations(search_history, industry, limit)
+        key = (fingerprint(search_history), industry, limit)
+
+        cached = self.cache.get_recommendations(member_id, key)
+        if cached is not None:
+            metrics.increment("recommendations.cache_hits")
+            return cached
+
+        generation = self.cache.generation(member_id)
+        result = await self._get_profile_recommendations(member_id, industry, limit)
+        if result is None:
+            if not allow_llm:
+                return None
+            result = await self.get_recommendations(search_history, industry, limit, member_id)
+        if result["strategy"] in CACHEABLE_STRATEGIES and not result.get("skipped_stages"):
+            self.cache.put_recommendations(member_id, key, generation, result)
+        return result
+
+    async def _get_profile_recommendations(
+        self,
+        member_id: int,
+        industry: str,
+        limit: int
+    ) -> Optional[Dict[str, Any]]:
+        profile = await self.member_profiles.get(member_id)
+        if profile is None or self.member_profiles.strength(profile) < settings.member_profile_min_weight:
+            return None
+
+        interests = self.member_profiles.top_interests(profile)
+        patterns: Dict[str, Dict[str, List[str]]] = {}
+        weights: Dict[str, float] = {}
+        for dimension, ranked in interests.items():
+            category = PROFILE_PATTERN_CATEGORIES.get(dimension, dimension)
+            patterns.setdefault(category, {})[dimension] = [value for value, _ in ranked]
+            for value, weight in ranked:
+                weights[value] = max(weights.get(value, 0.0), weight)
+
+        recommendations = []
+        composed = self._compose_profile_query(interests)
+        if composed is not None:
+            recommendations.append(composed)
+        recommendations.extend(self._filter_by_patterns(patterns, limit - len(recommendations), industry, weights))
+
+        metrics.increment("recommendations.profile_served")
+        return {
+            "recommendations": self._format_recommendations(recommendations, industry),
+            "strategy": "profile",
+            "total": len(recommendations),
+            "patterns": patterns,
+            "industry": industry,
+            "skipped_stages": deadline.skipped_stages()
+        }
+
+    def _compose_profile_query(self, interests: Dict[str, List[Tuple[str, float]]]) -> Optional[Dict[str, Any]]:
+        search_params: Dict[str, Any] = {}
+        parts = []
+        for dimension in PROFILE_QUERY_DIMENSIONS:
+            ranked = interests.get(dimension)
+            if not ranked:
+                continue
+            value = ranked[0][0]
+            parts.append(value)
+            search_params[dimension] = [value] if dimension in ("occupation", "brands") else value
+
+        if len(parts) < 2:
+            return None
+
+        search_params["limit"] = 100
+        return {
+            "query": " ".join(parts) + " 100명",
+            "category": "맞춤",
+            "reason": "최근 검색 관심사 기반 추천",
+            "personalized": True,
+            "search_params": search_params
+        }
+
+    async def _extract_patterns(
+        self,
+        search_history: List[str],
+        member_id: Optional[int]
+    ) -> Dict[str, Any]:
+        history_key = fingerprint(search_history)
+        if member_id is not None:
+            cached = self.cache.get_patterns(member_id, history_key)
+            if cached is not None:
+                metrics.increment("recommendations.pattern_cache_hits")
+                return cached
+
+        if not deadline.allows("personalized_recommendations", settings.recommendation_llm_min_budget):
+            return {}
+
+        try:
+            patterns = await recommendation_breaker.call(
+                lambda: self.insight_generator.extract_patterns(search_history)
+            )
+        except Exception:
+            return {}
+
+        if member_id is not None:
+            self.cache.put_patterns(member_id, history_key, patterns)
+        return patterns
 
     def _get_static_recommendations(self, limit: int, industry: str) -> Dict[str, Any]:
         random.seed(None)
@@ -228,7 +384,8 @@ class RecommendationService:
         self,
         patterns: Dict[str, Dict[str, List[str]]],
         limit: int,
-        industry: str
+        industry: str,
+        weights: Optional[Dict[str, float]] = None
     ) -> List[Dict[str, Any]]:
         mapped_industry = INDUSTRY_TO_JOB_MAPPING.get(industry, industry)
         industry_recs = INDUSTRY_RECOMMENDATIONS.get(
@@ -244,10 +401,11 @@ class RecommendationService:
             for category, field_dict in patterns.items():
                 for _, value_list in field_dict.items():
                     for value in value_list:
+                        weight = weights.get(value, 1.0) if weights else 1.0
                         if value.lower() in query_lower:
-                            score += 10
+                            score += 10 * weight
                         elif self._is_similar(value, query_lower):
-                            score += 5
+                            score += 5 * weight
 
             scored.append((score, rec))
 
@@ -0,0 +1,123 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.core.config import settings
+from src.api.schemas.search import PanelInfo
+
+
+@dataclass
+class CachedSearchResult:
+    panels: List[PanelInfo]
+    similarities: np.ndarray
+    columns: Dict[str, np.ndarray]
+    null_masks: Dict[str, np.ndarray]
+    panel_version: Optional[int]
+
+
+class RefineEngine:
+    FILTER_COLUMNS = [
+        'age', 'gender', 'residence', 'occupation',
+        'marital_status', 'phone_brand', 'car_brand'
+    ]
+
+    LIKE_COLUMNS = {'residence', 'occupation', 'phone_brand', 'car_brand'}
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._results: "OrderedDict[str, CachedSearchResult]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def store(
+        self,
+        search_id: str,
+        panels: List[PanelInfo],
+        similarities: List[Optional[float]],
+        panel_version: Optional[int]
+    ) -> None:
+        columns = {}
+        null_masks = {}
+        for column in self.FILTER_COLUMNS:
+            values = [getattr(panel, column) for panel in panels]
+            null_masks[column] = np.array([v is None for v in values], dtype=bool)
+            if column in self.LIKE_COLUMNS:
+                columns[column] = np.array(['' if v is None else str(v) for v in values], dtype=str)
+            else:
+                columns[column] = np.array(values, dtype=object)
+
+        self._results[search_id] = CachedSearchResult(
+            panels=list(panels),
+            similarities=np.array(
+                [np.nan if s is None else float(s) for s in similarities], dtype=np.float64
+            ),
+            columns=columns,
+            null_masks=null_masks,
+            panel_version=panel_version,
+        )
+        self._results.move_to_end(search_id)
+
+        while len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+
+    def refine(
+        self,
+        search_id: str,
+        additional_filters: Dict[str, Any],
+        panel_version: Optional[int]
+    ) -> Optional[Tuple[List[PanelInfo], List[Optional[float]], int]]:
+        cached = self._results.get(search_id)
+        if cached is not None and (panel_version is None or cached.panel_version != panel_version):
+            del self._results[search_id]
+            cached = None
+
+        if cached is None or not self._is_supported(additional_filters):
+            self.misses += 1
+            return None
+
+        self._results.move_to_end(search_id)
+        self.hits += 1
+
+        mask = np.ones(len(cached.panels), dtype=bool)
+        for key, value in additional_filters.items():
+            if key == 'similarity_threshold' or value is None:
+                continue
+            mask &= self._build_mask(cached, key, value)
+
+        indices = np.flatnonzero(mask)
+        similarities = cached.similarities[indices]
+        if not np.all(np.isnan(similarities)):
+            order = np.argsort(np.where(np.isnan(similarities), np.inf, -similarities), kind='stable')
+            indices = indices[order]
+            similarities = similarities[order]
+
+        panels = [cached.panels[i] for i in indices]
+        return panels, [None if np.isnan(s) else float(s) for s in similarities], len(cached.panels)
+
+    def _is_supported(self, additional_filters: Dict[str, Any]) -> bool:
+        for key, value in additional_filters.items():
+            if key == 'similarity_threshold' or value is None:
+                continue
+            if key not in self.FILTER_COLUMNS:
+                return False
+        return True
+
+    def _build_mask(self, cached: CachedSearchResult, key: str, value: Any) -> np.ndarray:
+        column = cached.columns[key]
+        not_null = ~cached.null_masks[key]
+        values = value if isinstance(value, list) else [value]
+
+        mask = np.zeros(len(column), dtype=bool)
+        if key in self.LIKE_COLUMNS:
+            for item in values:
+                mask |= np.char.find(column, str(item)) >= 0
+        else:
+            for item in values:
+                mask |= column == item
+
+        return mask & not_null
+
+
+refine_engine = RefineEngine(settings.refine_cache_max_entries)
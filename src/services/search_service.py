@@ -1,15 +1,36 @@
 from typing import Dict, Any, List, Optional, Tuple
-import uuid
-from datetime import datetime
+from dataclasses import dataclass
+import asyncio
 
+from src.core import deadline
 from src.core.config import settings
-from src.domain.models import Panel
+from src.core.cache import CachedResultSet, recommendation_cache, search_result_cache
+from src.core.exceptions import DeadlineExceededError, PanelSearchException
+from src.core.singleflight import search_flight, embedding_flight, fingerprint
+from src.services.feed_refresher import feed_refresher
+from src.services.member_profiles import member_profiles
+from src.services.refine_engine import refine_engine
+from src.domain.models import Panel, SearchHistory
 from src.domain.enums import SearchMode
-from src.repositories import PanelRepository, SearchHistoryRepository
+from src.repositories import PanelRepository, SearchHistoryRepository, search_history_writer
 from src.llm import QueryParser, EmbeddingService
 from src.api.schemas.search import PanelInfo
 
 
+@dataclass
+class PreparedSearch:
+    search_method: str
+    original_query: Optional[str]
+    filters: Dict[str, Any]
+    search_mode: str
+    limit: int
+    facets: Optional[List[str]]
+    cache_key: str
+    panel_version: Optional[int]
+    cached: Optional[CachedResultSet]
+    query_embedding: Optional[List[float]] = None
+
+
 class SearchService:
     SEMANTIC_FIELDS = [
         'lifestyle_tags', 'search_keywords',
@@ -20,8 +41,13 @@ class SearchService:
     def __init__(self):
         self.panel_repo = PanelRepository()
         self.search_history_repo = SearchHistoryRepository()
+        self.history_writer = search_history_writer
         self.query_parser = QueryParser()
         self.embedding_service = EmbeddingService()
+        self.result_cache = search_result_cache
+        self.refine_engine = refine_engine
+        self.member_profiles = member_profiles
+        self.feed_refresher = feed_refresher
 
     async def search(
         self,
@@ -30,53 +56,227 @@ class SearchService:
         structured_filters: Optional[Dict[str, Any]] = None,
         search_mode: str = "strict",
         limit: int = 100,
-        member_id: Optional[int] = None
+        member_id: Optional[int] = None,
+        facets: Optional[List[str]] = None
     ) -> Dict[str, Any]:
-        mode = SearchMode.STRICT if search_mode == "strict" else SearchMode.FLEXIBLE
-        search_method, original_query, filters = self._prepare_filters(
-            query, search_params, structured_filters, mode, limit
+        prepared = await self._prepare_search(
+            query, search_params, structured_filters, search_mode, limit, facets
         )
 
-        is_multi_condition = 'conditions' in filters and isinstance(filters['conditions'], list)
+        if prepared.cached is None and prepared.original_query:
+            prepared.query_embedding = await self._embed_query(prepared.original_query)
 
-        query_embedding = None
-        if original_query:
+        return await self._execute_search(prepared, member_id)
+
+    async def search_batch(
+        self,
+        searches: List[Dict[str, Any]],
+        member_id: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        prepared_list = await asyncio.gather(*[
+            self._prepare_search(
+                item.get("query"),
+                item.get("search_params"),
+                item.get("structured_filters"),
+                item.get("search_mode", "strict"),
+                item.get("limit", 100),
+                item.get("facets")
+            )
+            for item in searches
+        ], return_exceptions=True)
+
+        texts_to_embed = list(dict.fromkeys(
+            prepared.original_query
+            for prepared in prepared_list
+            if isinstance(prepared, PreparedSearch) and prepared.cached is None and prepared.original_query
+        ))
+
+        embeddings = {}
+        if texts_to_embed:
             try:
-                query_embedding = self.embedding_service.embed_text(original_query)
+                vectors = await asyncio.wait_for(
+                    asyncio.to_thread(self.embedding_service.embed_texts, texts_to_embed),
+                    deadline.timeout(operation="embedding")
+                )
+                embeddings = dict(zip(texts_to_embed, vectors))
+            except (asyncio.TimeoutError, DeadlineExceededError):
+                deadline.skip("semantic_ranking")
             except Exception:
-                query_embedding = None
+                embeddings = {}
+
+        async def run(index: int, prepared: Any) -> Dict[str, Any]:
+            if isinstance(prepared, Exception):
+                return self._batch_failure(index, prepared)
+
+            if prepared.original_query:
+                prepared.query_embedding = embeddings.get(prepared.original_query)
+
+            item_member_id = searches[index].get("member_id") or member_id
+            try:
+                result = await self._execute_search(prepared, item_member_id)
+            except Exception as e:
+                return self._batch_failure(index, e)
+            return {"index": index, "success": True, "result": result, "error": None}
+
+        return await asyncio.gather(*[
+            run(index, prepared) for index, prepared in enumerate(prepared_list)
+        ])
+
+    async def prefetch(
+        self,
+        search_params: Dict[str, Any],
+        search_mode: str = "flexible",
+        limit: int = 100
+    ) -> int:
+        prepared = await self._prepare_search(
+            None, dict(search_params), None, search_mode, limit, None
+        )
+        if prepared.cached is not None:
+            return len(prepared.cached.panel_ids)
+
+        panels, _ = await self._execute_single_search(
+            prepared.filters.copy(), None, prepared.filters.get('limit', limit)
+        )
+        self.result_cache.put(
+            prepared.cache_key, prepared.panel_version,
+            [p.panel_id for p in panels],
+            [p.similarity for p in panels]
+        )
+        return len(panels)
+
+    async def _prepare_search(
+        self,
+        query: Optional[str],
+        search_params: Optional[Dict[str, Any]],
+        structured_filters: Optional[Dict[str, Any]],
+        search_mode: str,
+        limit: int,
+        facets: Optional[List[str]]
+    ) -> PreparedSearch:
+        mode = SearchMode.STRICT if search_mode == "strict" else SearchMode.FLEXIBLE
+        search_method, original_query, filters = await self._prepare_filters(
+            query, search_params, structured_filters, mode, limit
+        )
+
+        embedding_id = f"{settings.embedding_model}:{original_query}" if original_query else None
+        cache_key = self.result_cache.make_key(filters, search_mode, limit, embedding_id, facets)
+        panel_version = await self.panel_repo.get_version()
+
+        return PreparedSearch(
+            search_method=search_method,
+            original_query=original_query,
+            filters=filters,
+            search_mode=search_mode,
+            limit=limit,
+            facets=facets,
+            cache_key=cache_key,
+            panel_version=panel_version,
+            cached=self.result_cache.get(cache_key, panel_version)
+        )
 
-        if is_multi_condition:
-            panels = await self._execute_multi_condition_search(
-                filters['conditions'], query_embedding
+    async def _execute_search(
+        self,
+        prepared: PreparedSearch,
+        member_id: Optional[int]
+    ) -> Dict[str, Any]:
+        filters = prepared.filters
+
+        if prepared.cached is not None:
+            panels = await self.panel_repo.get_by_ids_ordered(
+                list(prepared.cached.panel_ids), prepared.cached.similarity_list()
             )
+            facet_counts = prepared.cached.facets
         else:
-            panels = await self._execute_single_search(
-                filters, query_embedding, filters.get('limit', limit)
+            panels, facet_counts = await search_flight.do(
+                prepared.cache_key,
+                lambda: self._run_panel_search(prepared),
+                clone=lambda result: (list(result[0]), result[1])
             )
 
         panel_infos = self._convert_to_panel_info(panels, filters)
 
         search_id = await self._save_search_history(
-            member_id, original_query, panel_infos
+            member_id, prepared.original_query, panel_infos, filters
+        )
+        self.refine_engine.store(
+            search_id, panel_infos, [p.similarity for p in panels], prepared.panel_version
         )
 
         return {
             "search_id": search_id,
-            "query": original_query,
+            "query": prepared.original_query,
             "panels": panel_infos,
             "total_count": len(panel_infos),
-            "search_mode": search_mode,
+            "search_mode": prepared.search_mode,
             "applied_filters": filters,
-            "search_method": search_method
+            "search_method": prepared.search_method,
+            "facets": facet_counts
         }
 
+    async def _run_panel_search(
+        self,
+        prepared: PreparedSearch
+    ) -> Tuple[List[Panel], Optional[Dict[str, Dict[str, int]]]]:
+        filters = prepared.filters
+        if 'conditions' in filters and isinstance(filters['conditions'], list):
+            panels, facet_counts = await self._execute_multi_condition_search(
+                filters['conditions'], prepared.query_embedding, prepared.facets
+            )
+        else:
+            panels, facet_counts = await self._execute_single_search(
+                filters.copy(), prepared.query_embedding, filters.get('limit', prepared.limit), prepared.facets
+            )
+
+        self.result_cache.put(
+            prepared.cache_key, prepared.panel_version,
+            [p.panel_id for p in panels],
+            [p.similarity for p in panels],
+            facet_counts
+        )
+        return panels, facet_counts
+
+    async def _embed_query(self, text: str) -> Optional[List[float]]:
+        try:
+            return await asyncio.wait_for(
+                embedding_flight.do(
+                    fingerprint(settings.embedding_model, text),
+                    lambda: self.embedding_service.aembed_text(text),
+                    clone=list
+                ),
+                deadline.timeout(operation="embedding")
+            )
+        except (asyncio.TimeoutError, DeadlineExceededError):
+            deadline.skip("semantic_ranking")
+            return None
+        except Exception:
+            return None
+
+    def _batch_failure(self, index: int, error: Exception) -> Dict[str, Any]:
+        message = error.message if isinstance(error, PanelSearchException) else str(error)
+        return {"index": index, "success": False, "result": None, "error": message}
+
     async def refine_search(
         self,
         search_id: int,
         additional_filters: Dict[str, Any]
     ) -> Dict[str, Any]:
-        search_history = await self.search_history_repo.get_by_id(search_id)
+        panel_version = await self.panel_repo.get_version()
+        refined = self.refine_engine.refine(str(search_id), additional_filters, panel_version)
+        if refined is not None:
+            cached_panels, similarities, original_count = refined
+            is_simple = self._is_simple_filter_query(additional_filters)
+            panel_infos = [
+                panel.model_copy(update={"similarity": self._to_concordance(similarity, is_simple)})
+                for panel, similarity in zip(cached_panels, similarities)
+            ]
+            return {
+                "original_count": original_count,
+                "filtered_count": len(panel_infos),
+                "panels": panel_infos,
+                "applied_filters": additional_filters
+            }
+
+        search_history = await self._get_search_history(search_id)
         if not search_history:
             raise ValueError(f"Search {search_id} not found")
 
@@ -92,10 +292,7 @@ class SearchService:
         original_query = search_history.content
         query_embedding = None
         if original_query:
-            try:
-                query_embedding = self.embedding_service.embed_text(original_query)
-            except Exception:
-                query_embedding = None
+            query_embedding = await self._embed_query(original_query)
 
         panels = await self.panel_repo.search_by_ids(
             panel_ids, additional_filters, query_embedding
@@ -111,7 +308,7 @@ class SearchService:
         }
 
     async def get_search_info(self, search_id: int) -> Dict[str, Any]:
-        search_history = await self.search_history_repo.get_by_id(search_id)
+        search_history = await self._get_search_history(search_id)
         if not search_history:
             raise ValueError(f"Search {search_id} not found")
 
@@ -136,7 +333,7 @@ class SearchService:
             "created_at": str(search_history.date) if search_history.date else None
         }
 
-    def _prepare_filters(
+    async def _prepare_filters(
         self,
         query: Optional[str],
         search_params: Optional[Dict[str, Any]],
@@ -147,7 +344,7 @@ class SearchService:
         if query:
             search_method = "natural_language"
             original_query = query
-            filters = self.query_parser.parse_to_dict(query, mode)
+            filters = await self.query_parser.aparse_to_dict(query, mode)
 
             parsed_limit = filters.get('limit', 100)
             if parsed_limit == 100 and limit != 100:
@@ -205,21 +402,26 @@ class SearchService:
         self,
         filters: Dict[str, Any],
         query_embedding: Optional[List[float]],
-        limit: int
-    ) -> List[Panel]:
-        return await self.panel_repo.search(filters, query_embedding, limit)
+        limit: int,
+        facets: Optional[List[str]] = None
+    ) -> Tuple[List[Panel], Optional[Dict[str, Dict[str, int]]]]:
+        if facets is None:
+            return await self.panel_repo.search(filters, query_embedding, limit), None
+
+        return await self.panel_repo.search_with_facets(filters, query_embedding, limit, facets)
 
     async def _execute_multi_condition_search(
         self,
         conditions: List[Dict[str, Any]],
-        query_embedding: Optional[List[float]]
-    ) -> List[Panel]:
+        query_embedding: Optional[List[float]],
+        facets: Optional[List[str]] = None
+    ) -> Tuple[List[Panel], Optional[Dict[str, Dict[str, int]]]]:
         all_panels = []
         seen_ids = set()
 
         for condition in conditions:
             condition_limit = condition.get('limit', 100)
-            panels = await self.panel_repo.search(
+            panels, _ = await self._execute_single_search(
                 condition.copy(),
                 query_embedding,
                 condition_limit
@@ -230,7 +432,11 @@ class SearchService:
                     seen_ids.add(panel.panel_id)
                     all_panels.append(panel)
 
-        return all_panels
+        if facets is None:
+            return all_panels, None
+
+        facet_counts = await self.panel_repo.facet_counts([p.panel_id for p in all_panels], facets)
+        return all_panels, facet_counts
 
     def _convert_to_panel_info(
         self,
@@ -241,41 +447,27 @@ class SearchService:
         is_simple = self._is_simple_filter_query(filters)
 
         for panel in panels:
-            if panel.similarity is not None:
-                concordance = 1.0 if is_simple else self._normalize_concordance(panel.similarity)
-            else:
-                concordance = 1.0 if is_simple else None
+            concordance = self._to_concordance(panel.similarity, is_simple)
 
             profile_summary = panel.profile_summary
             if not profile_summary:
                 profile_summary = self._generate_fallback_summary(panel)
 
-            result.append(PanelInfo(
-                panel_id=panel.panel_id,
-                age=panel.age,
-                gender=panel.gender,
-                residence=panel.residence,
-                occupation=panel.occupation,
-                marital_status=panel.marital_status,
-                phone_brand=panel.phone_brand,
-                car_brand=panel.car_brand,
-                profile_summary=profile_summary,
-                hashtags=panel.hashtags,
-                electronic_devices=panel.electronic_devices,
-                smoking_experience=panel.smoking_experience,
-                cigarette_brands=panel.cigarette_brands,
-                e_cigarette=panel.e_cigarette,
-                drinking_experience=panel.drinking_experience,
-                survey_health=panel.survey_health,
-                survey_consumption=panel.survey_consumption,
-                survey_lifestyle=panel.survey_lifestyle,
-                survey_digital=panel.survey_digital,
-                survey_environment=panel.survey_environment,
-                similarity=concordance
-            ))
+            result.append(PanelInfo.model_construct(**{
+                **panel.__dict__,
+                "profile_summary": profile_summary,
+                "similarity": concordance
+            }))
 
         return result
 
+    def _to_concordance(self, similarity: Optional[float], is_simple: bool) -> Optional[float]:
+        if is_simple:
+            return 1.0
+        if similarity is None:
+            return None
+        return self._normalize_concordance(similarity)
+
     def _is_simple_filter_query(self, filters: Dict[str, Any]) -> bool:
         for field in self.SEMANTIC_FIELDS:
             if filters.get(field) is not None:
@@ -323,18 +515,26 @@ class SearchService:
         self,
         member_id: Optional[int],
         query: Optional[str],
-        panels: List[PanelInfo]
+        panels: List[PanelInfo],
+        filters: Dict[str, Any]
     ) -> str:
         panel_ids = [p.panel_id for p in panels]
         concordance_rates = [float(p.similarity) if p.similarity else 0.0 for p in panels]
 
-        try:
-            search_id = await self.search_history_repo.create(
-                member_id=member_id,
-                content=query or "",
-                panel_ids=panel_ids,
-                concordance_rates=concordance_rates
-            )
-            return str(search_id)
-        except Exception:
-            return str(uuid.uuid4())
+        search_id = await self.history_writer.submit(
+            member_id=member_id,
+            content=query or "",
+            panel_ids=panel_ids,
+            concordance_rates=concordance_rates
+        )
+        if member_id is not None:
+            self.member_profiles.submit(member_id, filters)
+            recommendation_cache.invalidate(member_id)
+            self.feed_refresher.mark_stale(member_id)
+        return str(search_id)
+
+    async def _get_search_history(self, search_id: int) -> Optional[SearchHistory]:
+        pending = self.history_writer.get_pending(search_id)
+        if pending is not None:
+            return pending
+        return await self.search_history_repo.get_by_id(search_id)
@@ -0,0 +1,90 @@
+import asyncio
+import time
+from typing import Any, Dict
+
+from src.core.config import settings
+from src.core.database import Database
+from src.llm.client import ANTHROPIC_BASE_URL
+from src.llm.http_clients import http_clients
+from src.llm.prompts import preload_prompts
+from .search_service import SearchService
+from .recommendation_service import RecommendationService, INDUSTRY_RECOMMENDATIONS
+
+
+async def warm_up(
+    search_service: SearchService,
+    recommendation_service: RecommendationService
+) -> Dict[str, Any]:
+    started_at = time.perf_counter()
+    report: Dict[str, Any] = {}
+
+    report["prompts"] = preload_prompts()
+
+    report["http_clients"] = await _warm_http_clients(search_service, recommendation_service)
+
+    pool = await Database.get_pool()
+    report["db_pool_size"] = pool.get_size()
+
+    await asyncio.gather(*[
+        _prepare_hot_statements(search_service)
+        for _ in range(settings.db_pool_min_size)
+    ])
+
+    if settings.warmup_industry_recommendations:
+        report["prefetched_recommendations"] = await _prefetch_industry_recommendations(
+            search_service, recommendation_service
+        )
+
+    report["elapsed_ms"] = round((time.perf_counter() - started_at) * 1000, 1)
+    return report
+
+
+async def _warm_http_clients(
+    search_service: SearchService,
+    recommendation_service: RecommendationService
+) -> Dict[str, Any]:
+    for llm in (
+        search_service.query_parser.llm,
+        search_service.query_parser.fast_llm,
+        recommendation_service.insight_generator.llm,
+    ):
+        llm._async_client
+
+    targets = {
+        "anthropic": ANTHROPIC_BASE_URL,
+        "upstage": search_service.embedding_service.embedder.upstage_api_base,
+    }
+    results = await asyncio.gather(
+        *[http_clients.preconnect(name, url) for name, url in targets.items()],
+        return_exceptions=True
+    )
+    return {
+        name: result if isinstance(result, int) else f"error: {result}"
+        for name, result in zip(targets, results)
+    }
+
+
+async def _prepare_hot_statements(search_service: SearchService) -> None:
+    await search_service.search_history_repo.get_by_id(-1)
+    await search_service.search_history_repo.get_recent_queries(-1, 1)
+    await search_service.panel_repo.get_by_ids_ordered(["__warmup__"], [None])
+
+
+async def _prefetch_industry_recommendations(
+    search_service: SearchService,
+    recommendation_service: RecommendationService
+) -> int:
+    prefetched = 0
+    for recommendations in INDUSTRY_RECOMMENDATIONS.values():
+        for rec in recommendations:
+            search_params = recommendation_service._extract_search_params(rec["query"])
+            try:
+                await search_service.prefetch(
+                    search_params,
+                    search_mode="flexible",
+                    limit=search_params.get("limit", 100)
+                )
+                prefetched += 1
+            except Exception:
+                continue
+    return prefetched
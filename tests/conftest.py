@@ -0,0 +1,4 @@
+import os
+
+os.environ.setdefault("ANTHROPIC_API_KEY", "test")
+os.environ.setdefault("UPSTAGE_API_KEY", "test")
@@ -0,0 +1,35 @@
+import asyncio
+
+import pytest
+
+from src.core.circuit_breaker import CircuitBreaker, HALF_OPEN
+from src.core.exceptions import LLMOverloadedError
+
+
+@pytest.mark.parametrize("error", [asyncio.CancelledError(), GeneratorExit(), LLMOverloadedError("m", "queue full")])
+def test_non_upstream_failures_do_not_count_against_the_circuit(error):
+    breaker = CircuitBreaker("test")
+
+    async def main():
+        with pytest.raises(type(error)):
+            async with breaker.guard():
+                raise error
+
+    asyncio.run(main())
+
+    assert breaker.snapshot()["window"] == 0
+
+
+def test_cancelled_half_open_probe_releases_the_probe_slot():
+    breaker = CircuitBreaker("test")
+    breaker.state = HALF_OPEN
+
+    async def main():
+        with pytest.raises(asyncio.CancelledError):
+            async with breaker.guard():
+                raise asyncio.CancelledError()
+
+    asyncio.run(main())
+
+    assert breaker.state == HALF_OPEN
+    assert breaker._allow()
@@ -0,0 +1,40 @@
+import asyncio
+from types import SimpleNamespace
+
+from src.services.comparison_service import ComparisonService
+
+
+def test_stream_reports_failed_sections_and_finishes():
+    service = ComparisonService()
+    cohort = SimpleNamespace(panel_ids=["p1"], panel_count=1)
+
+    async def load_cohorts(cohort_1_id, cohort_2_id):
+        return cohort, cohort, {"id": 1}, {"id": 2}
+
+    async def failing(*args):
+        raise RuntimeError("boom")
+
+    async def empty(*args):
+        return {}
+
+    service._load_cohorts = load_cohorts
+    service._compare_metrics = failing
+    service._compare_basic_info = empty
+    service._find_characteristics = empty
+    service._calculate_region_distribution = empty
+    service._calculate_gender_distribution = empty
+
+    async def collect():
+        return [event async for event in service.stream_comparison(1, 2)]
+
+    events = asyncio.run(collect())
+    names = [name for name, _ in events]
+
+    assert names[0] == "cohorts"
+    assert "summary" not in names
+    assert ("error", {"stage": "comparisons", "error": "INTERNAL_SERVER_ERROR", "message": "boom"}) in events
+    assert events[-1] == ("done", {
+        "key_insights": None,
+        "skipped_stages": [],
+        "failed_stages": ["comparisons", "insights"],
+    })
@@ -0,0 +1,47 @@
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from src.api.middleware import CompressionMiddleware
+from src.api.responses import etag_json_response
+
+
+def make_client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=16)
+
+    @app.get("/large")
+    async def large(request: Request):
+        return etag_json_response(request, {"items": list(range(100))})
+
+    @app.get("/small")
+    async def small(request: Request):
+        return etag_json_response(request, {"ok": True})
+
+    return TestClient(app)
+
+
+def test_compressed_response_has_weak_etag_and_vary():
+    client = make_client()
+
+    plain = client.get("/large", headers={"Accept-Encoding": "identity"})
+    compressed = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+    assert "Accept-Encoding" in plain.headers["vary"]
+    assert "Accept-Encoding" in compressed.headers["vary"]
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["etag"] == f"W/{plain.headers['etag']}"
+
+
+def test_weak_etag_revalidates_and_small_bodies_still_vary():
+    client = make_client()
+
+    first = client.get("/large", headers={"Accept-Encoding": "gzip"})
+    revalidated = client.get(
+        "/large", headers={"Accept-Encoding": "gzip", "If-None-Match": first.headers["etag"]}
+    )
+    small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == first.headers["etag"]
+    assert "content-encoding" not in small.headers
+    assert "Accept-Encoding" in small.headers["vary"]
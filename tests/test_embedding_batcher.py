@@ -0,0 +1,30 @@
+import asyncio
+
+from src.llm.embeddings import EmbeddingBatcher
+
+
+def test_short_upstream_response_fails_every_waiter():
+    def embed_texts(texts):
+        return [[1.0]] * (len(texts) - 1)
+
+    async def scenario():
+        batcher = EmbeddingBatcher(embed_texts, window_ms=1, max_batch=8)
+        return await asyncio.wait_for(
+            asyncio.gather(*[batcher.embed(text) for text in ("a", "b", "c")], return_exceptions=True), 1
+        )
+
+    results = asyncio.run(scenario())
+
+    assert len(results) == 3
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_batched_waiters_get_their_own_vectors():
+    def embed_texts(texts):
+        return [[float(len(text))] for text in texts]
+
+    async def scenario():
+        batcher = EmbeddingBatcher(embed_texts, window_ms=1, max_batch=8)
+        return await asyncio.gather(*[batcher.embed(text) for text in ("a", "bb", "a")])
+
+    assert asyncio.run(scenario()) == [[1.0], [2.0], [1.0]]
@@ -0,0 +1,57 @@
+import asyncio
+
+from src.core.config import settings
+from src.llm.limiter import LLMPriority, ModelLimiter
+
+
+def test_queued_request_admitted_when_bucket_refills_with_nothing_in_flight(monkeypatch):
+    monkeypatch.setattr(settings, "llm_burst", 2)
+    monkeypatch.setattr(settings, "llm_requests_per_second", 20.0)
+    monkeypatch.setattr(settings, "llm_queue_timeout", 3.0)
+
+    async def scenario():
+        limiter = ModelLimiter("test-model")
+        for _ in range(2):
+            await limiter.acquire(LLMPriority.INTERACTIVE)
+            limiter.release(0.01, throttled=False)
+
+        assert limiter.in_flight == 0
+        assert limiter.tokens < 1
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await asyncio.wait_for(limiter.acquire(LLMPriority.INTERACTIVE), 1.0)
+        assert loop.time() - started < 0.5
+        assert limiter.in_flight == 1
+
+    asyncio.run(scenario())
+
+
+def test_interactive_lane_is_admitted_before_background(monkeypatch):
+    monkeypatch.setattr(settings, "llm_burst", 1)
+    monkeypatch.setattr(settings, "llm_requests_per_second", 20.0)
+
+    async def scenario():
+        limiter = ModelLimiter("test-model")
+        await limiter.acquire(LLMPriority.INTERACTIVE)
+
+        order = []
+
+        async def waiter(priority):
+            await limiter.acquire(priority)
+            order.append(priority)
+
+        background = asyncio.create_task(waiter(LLMPriority.BACKGROUND))
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(waiter(LLMPriority.INTERACTIVE))
+        await asyncio.sleep(0)
+
+        limiter.limit = 1
+        limiter.release(0.01, throttled=False)
+        await asyncio.wait_for(interactive, 1.0)
+        limiter.release(0.01, throttled=False)
+        await asyncio.wait_for(background, 1.0)
+
+        assert order == [LLMPriority.INTERACTIVE, LLMPriority.BACKGROUND]
+
+    asyncio.run(scenario())
@@ -0,0 +1,107 @@
+import asyncio
+
+from src.core import deadline
+from src.core.config import settings
+from src.services.member_profiles import MemberProfileStore
+
+
+def test_interests_use_display_terms_for_canonical_filter_values():
+    store = MemberProfileStore()
+
+    interests = store.extract_interests({
+        "gender": "FEMALE",
+        "age_group": ["20대 후반", "30대", "40대 초반"],
+        "residence": ["서울", "경기"],
+        "brands": ["아이폰"],
+    })
+
+    assert interests == {
+        "age_group": ["30대"],
+        "gender": ["여성"],
+        "region": ["서울"],
+        "brands": ["아이폰"],
+    }
+
+
+def test_multi_condition_interests_merge_every_condition():
+    store = MemberProfileStore()
+
+    interests = store.extract_interests({
+        "conditions": [
+            {"age_group": ["10대 후반", "20대", "30대 초반", "20대 후반", "30대", "40대 초반"]},
+            {"region": "부산", "car_brand": ["BMW"], "survey_digital": {"OTT개수": "high"}},
+        ]
+    })
+
+    assert interests == {
+        "age_group": ["20대", "30대"],
+        "region": ["부산"],
+        "brands": ["BMW"],
+        "survey_digital": ["OTT개수"],
+    }
+
+
+class SlowRepository:
+    def __init__(self):
+        self.loaded = None
+        self.saved = []
+
+    async def get(self, member_id):
+        await self.loaded.wait()
+        return None
+
+    async def upsert_many(self, profiles):
+        self.saved.extend(profiles)
+
+
+def test_submit_does_not_wait_for_profile_load():
+    async def scenario():
+        repository = SlowRepository()
+        repository.loaded = asyncio.Event()
+        store = MemberProfileStore(repository)
+
+        store.submit(7, {"gender": "MALE"})
+        assert repository.saved == []
+
+        repository.loaded.set()
+        await store.close()
+
+        assert [p.member_id for p in repository.saved] == [7]
+        assert repository.saved[0].counters == {"gender": {"남성": 1.0}}
+
+    asyncio.run(scenario())
+
+
+class FlakyRepository:
+    def __init__(self, failures):
+        self.failures = failures
+        self.saved = []
+        self.budgets = []
+
+    async def get(self, member_id):
+        return None
+
+    async def upsert_many(self, profiles):
+        self.budgets.append(deadline.remaining())
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("database unavailable")
+        self.saved.extend(profiles)
+
+
+def test_profile_updates_ignore_the_request_deadline_and_retry_failed_flushes(monkeypatch):
+    monkeypatch.setattr(settings, "member_profile_flush_interval", 0.01)
+
+    async def scenario():
+        repository = FlakyRepository(failures=2)
+        store = MemberProfileStore(repository)
+
+        deadline.start(0.001)
+        store.submit(7, {"gender": "MALE"})
+        await asyncio.sleep(0.2)
+
+        assert [p.member_id for p in repository.saved] == [7]
+        assert store._dirty == {}
+        assert repository.budgets == [None, None, None]
+
+    asyncio.run(scenario())
@@ -0,0 +1,50 @@
+import asyncio
+import os
+
+import pytest
+
+from src.core.config import settings
+from src.core.database import Database
+from src.repositories.panel_repository import PanelRepository
+
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("PANEL_SEARCH_TEST_DB"),
+    reason="set PANEL_SEARCH_TEST_DB=1 to run against the configured Postgres"
+)
+
+SCHEMA = """
+    CREATE TEMP TABLE panel (
+        id text PRIMARY KEY, age integer, gender text, residence text, occupation text,
+        marital_status text, phone_brand text, car_brand text, profile_summary text,
+        hash_tags text[], electronic_devices text[], smoking_experience text[],
+        cigarette_brands text[], e_cigarette text[], drinking_experience text[],
+        survey_health jsonb, survey_consumption jsonb, survey_lifestyle jsonb,
+        survey_digital jsonb, survey_environment jsonb
+    )
+"""
+
+
+def test_refine_fallback_selects_the_same_columns_as_cached_panels(monkeypatch):
+    monkeypatch.setattr(settings, "db_pool_min_size", 1)
+    monkeypatch.setattr(settings, "db_pool_max_size", 1)
+
+    async def scenario():
+        try:
+            await Database.execute(SCHEMA)
+            await Database.execute("""
+                INSERT INTO panel (id, age, gender, residence, survey_health, survey_digital)
+                VALUES ('p1', 31, 'FEMALE', '서울 강남구', '{"운동": "주 3회"}', '{"OTT개수": "3"}')
+            """)
+
+            repository = PanelRepository()
+            cached = await repository.get_by_ids_ordered(["p1"], [None])
+            refined = await repository.search_by_ids(["p1"], {"gender": "FEMALE"})
+            return cached, refined
+        finally:
+            await Database.close_pool()
+
+    cached, refined = asyncio.run(scenario())
+
+    assert refined[0].survey_health == {"운동": "주 3회"}
+    assert refined[0].model_dump() == cached[0].model_dump()
@@ -0,0 +1,24 @@
+from src.core.cache import MemberRecommendationCache
+
+
+def test_generations_are_bounded_by_max_members():
+    cache = MemberRecommendationCache(max_members=2)
+
+    for member_id in range(10):
+        cache.invalidate(member_id)
+
+    assert cache.stats()["generations"] == 2
+
+
+def test_evicted_generation_still_rejects_stale_results():
+    cache = MemberRecommendationCache(max_members=1)
+    started = cache.generation(1)
+
+    cache.invalidate(1)
+    cache.invalidate(2)
+    cache.put_recommendations(1, ("key",), started, {"stale": True})
+
+    assert cache.get_recommendations(1, ("key",)) is None
+
+    cache.put_recommendations(1, ("key",), cache.generation(1), {"fresh": True})
+    assert cache.get_recommendations(1, ("key",)) == {"fresh": True}
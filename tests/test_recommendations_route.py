@@ -0,0 +1,29 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.routes import recommendations
+from src.core.cache import MemberRecommendationCache
+
+
+def test_recommendations_reuse_cached_patterns_for_a_member(monkeypatch):
+    service = recommendations.recommendation_service
+    calls = []
+
+    async def extract_patterns(search_history):
+        calls.append(list(search_history))
+        return {"demographics": {"age": ["30대"]}}
+
+    monkeypatch.setattr(service, "cache", MemberRecommendationCache(max_members=10))
+    monkeypatch.setattr(service.insight_generator, "extract_patterns", extract_patterns)
+
+    app = FastAPI()
+    app.include_router(recommendations.router)
+    client = TestClient(app)
+    body = {"member_id": 7, "search_history": ["서울 30대 여성", "30대 직장인"]}
+
+    first = client.post("/api/quick-search/recommendations", json=body)
+    second = client.post("/api/quick-search/recommendations", json=body)
+
+    assert first.status_code == second.status_code == 200
+    assert second.json()["patterns"] == {"demographics": {"age": ["30대"]}}
+    assert calls == [["서울 30대 여성", "30대 직장인"]]
@@ -0,0 +1,30 @@
+from src.api.schemas.search import PanelInfo
+from src.services.refine_engine import RefineEngine
+
+
+def make_engine() -> RefineEngine:
+    engine = RefineEngine(max_entries=4)
+    panels = [
+        PanelInfo(panel_id="p1", gender="MALE", residence="서울 강남구"),
+        PanelInfo(panel_id="p2", gender="FEMALE", residence="부산 해운대구"),
+    ]
+    engine.store("1", panels, [0.9, 0.8], panel_version=3)
+    return engine
+
+
+def test_refine_serves_entries_for_the_current_panel_version():
+    engine = make_engine()
+
+    panels, similarities, original_count = engine.refine("1", {"gender": "FEMALE"}, panel_version=3)
+
+    assert [p.panel_id for p in panels] == ["p2"]
+    assert similarities == [0.8]
+    assert original_count == 2
+
+
+def test_refine_treats_a_panel_version_change_as_a_miss():
+    engine = make_engine()
+
+    assert engine.refine("1", {"gender": "FEMALE"}, panel_version=4) is None
+    assert engine.refine("1", {"gender": "FEMALE"}, panel_version=3) is None
+    assert engine.misses == 2
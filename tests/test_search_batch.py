@@ -0,0 +1,39 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+from src.core import deadline
+from src.services.search_service import PreparedSearch, SearchService
+
+
+def test_batch_embedding_respects_the_request_deadline():
+    service = SearchService()
+
+    def slow_embed_texts(texts):
+        time.sleep(0.3)
+        return [[1.0] for _ in texts]
+
+    async def prepare(query, search_params, structured_filters, search_mode, limit, facets):
+        return PreparedSearch(
+            search_method="natural_language", original_query=query, filters={}, search_mode=search_mode,
+            limit=limit, facets=facets, cache_key=query, panel_version=None, cached=None
+        )
+
+    async def execute(prepared, member_id):
+        return {"embedded": prepared.query_embedding is not None}
+
+    service.embedding_service = SimpleNamespace(embed_texts=slow_embed_texts)
+    service._prepare_search = prepare
+    service._execute_search = execute
+
+    async def scenario():
+        deadline.start(0.05)
+        started = time.monotonic()
+        results = await service.search_batch([{"query": "서울 30대"}, {"query": "부산 20대"}])
+        return results, time.monotonic() - started, deadline.skipped_stages()
+
+    results, elapsed, skipped = asyncio.run(scenario())
+
+    assert elapsed < 0.25
+    assert [r["result"] for r in results] == [{"embedded": False}, {"embedded": False}]
+    assert skipped == ["semantic_ranking"]
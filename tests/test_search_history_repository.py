@@ -0,0 +1,61 @@
+import asyncio
+import datetime
+import os
+
+import pytest
+
+from src.core.config import settings
+from src.core.database import Database
+from src.domain.models import SearchHistory
+from src.repositories.search_history_repository import SearchHistoryRepository
+
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("PANEL_SEARCH_TEST_DB"),
+    reason="set PANEL_SEARCH_TEST_DB=1 to run against the configured Postgres"
+)
+
+SCHEMA = [
+    "CREATE TEMP TABLE panel (id text PRIMARY KEY, seq serial UNIQUE)",
+    """
+    CREATE TEMP TABLE search_history (
+        id bigint PRIMARY KEY,
+        member_id integer,
+        content text,
+        panel_ids text[],
+        concordance_rate double precision[],
+        panel_seqs int4[],
+        concordance_rates real[],
+        date date,
+        created_date date DEFAULT current_date
+    )
+    """,
+]
+
+
+def test_compact_read_keeps_ids_and_rates_aligned_after_a_panel_is_deleted(monkeypatch):
+    monkeypatch.setattr(settings, "history_compact_storage", True)
+    monkeypatch.setattr(settings, "db_pool_min_size", 1)
+    monkeypatch.setattr(settings, "db_pool_max_size", 1)
+
+    async def scenario():
+        try:
+            for statement in SCHEMA:
+                await Database.execute(statement)
+            await Database.execute("INSERT INTO panel (id) VALUES ('p1'), ('p2'), ('p3')")
+
+            repository = SearchHistoryRepository()
+            await repository.create_many([SearchHistory(
+                id=1, content="query", panel_ids=["p1", "p2", "p3"],
+                concordance_rate=[0.9, 0.8, 0.7], date=datetime.date.today()
+            )])
+            await Database.execute("DELETE FROM panel WHERE id = 'p2'")
+
+            return await repository.get_by_id(1)
+        finally:
+            await Database.close_pool()
+
+    history = asyncio.run(scenario())
+
+    assert history.panel_ids == ["p1", "p3"]
+    assert history.concordance_rate == pytest.approx([0.9, 0.7])
@@ -0,0 +1,36 @@
+import asyncio
+import logging
+
+from src.core.config import settings
+from src.repositories.search_history_writer import SearchHistoryWriter
+
+
+class StalledRepository:
+    def __init__(self):
+        self.next_id = 0
+
+    async def allocate_ids(self, count):
+        ids = list(range(self.next_id + 1, self.next_id + count + 1))
+        self.next_id += count
+        return ids
+
+    async def create_many(self, histories):
+        await asyncio.sleep(60)
+
+
+def test_close_gives_up_after_drain_timeout_and_logs_dropped_ids(monkeypatch, caplog):
+    monkeypatch.setattr(settings, "history_drain_timeout", 0.05)
+
+    async def main():
+        writer = SearchHistoryWriter(StalledRepository())
+        search_id = await writer.submit(1, "query", ["p1"], [1.0])
+        await asyncio.sleep(0.01)
+        await asyncio.wait_for(writer.close(), 1)
+        return writer, search_id
+
+    with caplog.at_level(logging.ERROR):
+        writer, search_id = asyncio.run(main())
+
+    assert writer.dropped == 1
+    assert writer.get_pending(search_id) is None
+    assert f"search_ids=[{search_id}]" in caplog.text
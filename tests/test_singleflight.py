@@ -0,0 +1,48 @@
+import asyncio
+
+import pytest
+
+from src.core import deadline
+from src.core.config import settings
+from src.core.exceptions import DeadlineExceededError
+from src.core.singleflight import SingleFlight
+
+
+def test_shared_call_runs_on_its_own_budget_and_each_caller_bounds_its_wait():
+    flight = SingleFlight("test")
+    seen = []
+
+    async def work():
+        seen.append(deadline.remaining())
+        await asyncio.sleep(0.1)
+        return "done"
+
+    async def impatient():
+        deadline.start(0.02)
+        with pytest.raises(DeadlineExceededError):
+            await flight.do("key", work)
+
+    async def patient():
+        await asyncio.sleep(0)
+        return await flight.do("key", work)
+
+    async def main():
+        return await asyncio.gather(asyncio.create_task(impatient()), asyncio.create_task(patient()))
+
+    _, result = asyncio.run(main())
+
+    assert len(seen) == 1
+    assert 0 < seen[0] <= 0.02
+    assert result == "done"
+
+
+def test_shared_call_without_a_caller_deadline_is_capped(monkeypatch):
+    monkeypatch.setattr(settings, "singleflight_max_budget", 5.0)
+    flight = SingleFlight("test")
+
+    async def work():
+        return deadline.timeout(operation="database")
+
+    timeout = asyncio.run(flight.do("key", work))
+
+    assert 4.9 < timeout <= 5.0